@@ -0,0 +1,98 @@
+"""
+Rough benchmarks for the hot paths of tkintertools
+
+Run it directly: `python benchmark.py`
+"""
+
+import random
+import timeit
+
+from tkintertools import core
+from tkintertools.color import rgb
+from tkintertools.standard import shapes
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<40}{seconds / number * 1000:>10.3f} ms")
+
+
+def bench_colors(count: int = 10000, number: int = 20) -> None:
+    """Scalar color functions versus their array variants"""
+    print(f"--- colors ({count} colors, numpy: {rgb.numpy is not None}) ---")
+    first = [tuple(random.randrange(256) for _ in range(3)) for _ in range(count)]
+    second = [tuple(random.randrange(256) for _ in range(3)) for _ in range(count)]
+    groups = [list(pair) for pair in zip(first, second)]
+
+    report("convert (scalar)", timeit.timeit(
+        lambda: [rgb.convert(a, b, 0.3) for a, b in zip(first, second)], number=number), number)
+    report("convert_array", timeit.timeit(
+        lambda: rgb.convert_array(first, second, 0.3), number=number), number)
+    report("blend (scalar)", timeit.timeit(
+        lambda: [rgb.blend(group) for group in groups], number=number), number)
+    report("blend_array", timeit.timeit(
+        lambda: rgb.blend_array(groups), number=number), number)
+    report("convert + rgb_to_str (scalar)", timeit.timeit(
+        lambda: [rgb.rgb_to_str(rgb.convert(a, b, 0.3)) for a, b in zip(first, second)], number=number), number)
+    report("convert_array + rgb_to_str_array", timeit.timeit(
+        lambda: rgb.rgb_to_str_array(rgb.convert_array(first, second, 0.3)), number=number), number)
+
+
+def bench_resize(counts: tuple[int, ...] = (1000, 5000, 20000), number: int = 10) -> None:
+    """Cost of zooming the contents of a `Canvas` versus the number of items (needs a display)"""
+    print("--- resize ---")
+    root = core.Tk()
+    for count in counts:
+        canvas = core.Canvas(root)
+        for i in range(count // 2):
+            x, y = i % 100 * 10, i // 100 * 10
+            canvas.create_rectangle(x, y, x+8, y+8)
+            canvas.create_text(x, y, text="T", font=("", 10 + i % 4))
+        ratios = [(1.01, 1.01), (1/1.01, 1/1.01)] * number
+
+        def zoom_per_item() -> None:
+            for ratio in ratios:
+                for item in canvas.find_all():
+                    canvas.scale(item, 0, 0, *ratio)
+
+        def zoom() -> None:
+            for ratio in ratios:
+                canvas._zoom_items(ratio)
+                canvas._zoom_texts(ratio)
+
+        report(f"per-item scale ({count} items)", timeit.timeit(zoom_per_item, number=1), len(ratios))
+        report(f"_zoom_items + _zoom_texts ({count} items)", timeit.timeit(zoom, number=1), len(ratios))
+        canvas.destroy()
+    root.destroy()
+
+
+def bench_shapes(count: int = 500, number: int = 10) -> None:
+    """Items and update latency of rounded shapes in `arc` and `polygon` mode (needs a display)"""
+    print(f"--- shapes ({count} shapes) ---")
+    # Explicit styles that differ per state, so that every update configures the items
+    styles = {"normal": {"fill": "#1E1E1E", "outline": "#3C3C3C"},
+              "hover": {"fill": "#0076F8", "outline": "#DCDCDC"}}
+    root = core.Tk()
+    for mode in ("arc", "polygon"):
+        canvas = core.Canvas(root)
+        widgets = []
+        for i in range(count):
+            widget = core.Widget(canvas, (i % 20 * 60, i // 20 * 30), (50, 24))
+            shapes.RoundedRectangle(widget, mode=mode, styles=styles)
+            widgets.append(widget)
+        print(f"{mode + ' items':<40}{len(canvas.find_all()):>10}")
+
+        def update() -> None:
+            for state in ("hover", "normal") * number:
+                for widget in widgets:
+                    widget.update(state, no_delay=True)
+                canvas.update_idletasks()
+
+        report(f"{mode} update (all shapes)", timeit.timeit(update, number=1), 2*number)
+        canvas.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    bench_colors()
+    bench_resize()
+    bench_shapes()
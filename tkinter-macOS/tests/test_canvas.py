@@ -0,0 +1,39 @@
+"""Tests for the scrollable mode of Canvas (needs a display)"""
+
+import tkinter
+import unittest
+
+from tkintertools import core
+
+
+class ScrollableTest(unittest.TestCase):
+    """Widgets out of view of a scrollable `Canvas`"""
+
+    def setUp(self) -> None:
+        try:
+            self.root = core.Tk()
+        except tkinter.TclError as error:
+            self.skipTest(f"No display: {error}")
+        self.canvas = core.Canvas(self.root, scrollable=True, width=100, height=100)
+        self.canvas.pack()
+        self.root.update()
+
+    def tearDown(self) -> None:
+        self.root.destroy()
+
+    def test_move_culled_after_zoom(self) -> None:
+        widget = core.Widget(self.canvas, (500, 500), (20, 20))
+        self.assertIn(widget, self.canvas._culled)
+        self.canvas._zoom_widgets((2, 2))  # Pending until the widget comes into view
+        widget.move(10, 10)
+        self.assertEqual((widget.x, widget.y, widget.w, widget.h), (1010, 1010, 40, 40))
+
+    def test_scroll_to_is_clamped(self) -> None:
+        core.Widget(self.canvas, (500, 500), (20, 20))
+        self.canvas.scroll_to(10000, -50)
+        x1, y1, x2, y2 = self.canvas._view_region()
+        self.assertEqual((x2, y1), (520, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
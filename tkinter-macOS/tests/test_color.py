@@ -0,0 +1,44 @@
+"""Tests for the array variants of the color functions"""
+
+import typing
+import unittest
+
+from tkintertools.color import rgb
+
+
+class ArrayTest(unittest.TestCase):
+    """The NumPy path and the pure Python path give the same results"""
+
+    def _check_both(self, function: typing.Callable[[], typing.Any], expected: list) -> None:
+        """Call the function with and without NumPy, and compare both results with the expected one"""
+        backend = rgb.numpy
+        try:
+            for rgb.numpy in {backend, None}:
+                with self.subTest(numpy=rgb.numpy is not None):
+                    result = function()
+                    if rgb.numpy is not None and isinstance(result, rgb.numpy.ndarray):
+                        result = [tuple(value) for value in result.tolist()]
+                    self.assertEqual(result, expected)
+        finally:
+            rgb.numpy = backend
+
+    def test_convert_array_empty(self) -> None:
+        self._check_both(lambda: rgb.convert_array([], [], 0.5), [])
+        self._check_both(lambda: rgb.convert_array([], [], []), [])
+
+    def test_blend_array_empty(self) -> None:
+        self._check_both(lambda: rgb.blend_array([]), [])
+        self._check_both(lambda: rgb.blend_array([], weights=[1, 2]), [])
+
+    def test_rgb_to_str_array_empty(self) -> None:
+        self._check_both(lambda: rgb.rgb_to_str_array(rgb.convert_array([], [], 0.5)), [])
+
+    def test_convert_array(self) -> None:
+        self._check_both(lambda: rgb.convert_array(
+            [(0, 0, 0), (255, 0, 0)], [(255, 255, 255), (0, 0, 255)], 0.5), [(128, 128, 128), (127, 0, 128)])
+        self._check_both(lambda: rgb.rgb_to_str_array(rgb.convert_array(
+            [(0, 0, 0)], [(255, 255, 255)], 0.5)), ["#808080"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 """Standard animations"""
 
+import functools
 import numbers
+import sys
+import time
 import tkinter
 import typing
 
@@ -9,6 +12,83 @@ from ..color import rgb
 from . import controllers
 
 
+class _Clock:
+    """
+    Internal Class: A single timer of a Tk root that drives all of its active animations
+
+    Each tick plays the frames that are due for every active animation, and the timer
+    stops when there is no active animation left
+    """
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        """
+        * `root`: the Tk root that the timer belongs to
+        """
+        self.root = root
+        self._animations: dict[Animation, None] = {}
+        self._job: str | None = None
+        self._due: float = 0
+
+    def add(self, animation: "Animation") -> None:
+        """Add an animation to the clock"""
+        self._animations[animation] = None
+        self._schedule(animation._due(animation._frame + 1))
+
+    def remove(self, animation: "Animation") -> None:
+        """Remove an animation from the clock"""
+        self._animations.pop(animation, None)
+
+    def _schedule(self, due: float) -> None:
+        """Internal Method: Make sure the timer ticks no later than the specified time"""
+        if self._job is not None:
+            if self._due <= due:
+                return
+            self.root.after_cancel(self._job)
+        self._due = due
+        delay = max(0, round(due - time.perf_counter()*1000))
+        self._job = self.root.after(delay, self._tick)
+
+    def _tick(self) -> None:
+        """Internal Method: Play the frames that are due"""
+        self._job = None
+        now = time.perf_counter()*1000
+        for animation in tuple(self._animations):
+            if animation in self._animations:
+                try:
+                    animation._advance(now)
+                except Exception:
+                    self.remove(animation)
+                    self.root.report_callback_exception(*sys.exc_info())
+        if self._animations:
+            self._schedule(min(animation._due(animation._frame + 1)
+                               for animation in self._animations))
+
+
+_clocks: dict[tkinter.Misc, _Clock] = {}
+
+
+def _get_clock(root: tkinter.Misc) -> _Clock:
+    """
+    Internal Function: Get the clock of a Tk root, and create one if it does not exist
+
+    The clock is dropped when the Tk root is destroyed
+    """
+    if (clock := _clocks.get(root)) is None:
+        clock = _clocks[root] = _Clock(root)
+        root.bind("<Destroy>", lambda event: _drop_clock(
+            root) if event.widget is root else None, "+")
+    return clock
+
+
+def _drop_clock(root: tkinter.Misc) -> None:
+    """Internal Function: Forget the clock of a Tk root and stop its timer"""
+    if (clock := _clocks.pop(root, None)) is not None:
+        clock._animations.clear()
+        if clock._job is not None:
+            root.after_cancel(clock._job)
+            clock._job = None
+
+
 class Animation:
     """Base Class for Animation"""
 
@@ -47,18 +127,42 @@ class Animation:
         else:
             self._delay = self.ms
             self._total, self._leave = 1, -1
-        self._tasks: list[str] = []
+        self._clock: _Clock | None = None
+        self._start: float = 0
+        self._frame: int = 0
+        self._last_value: float = 0
+
+    def _due(self, index: int) -> float:
+        """Internal Method: Get the time (ms) at which the frame of the index is due"""
+        return self._start + index*self._delay + max(0, min(index, self._leave-1))
+
+    def _advance(self, now: float) -> None:
+        """
+        Internal Method: Play the latest frame that is due
 
-    def _wrapper(self, func: typing.Callable[[float], float]) -> typing.Callable[[float], float]:
-        """Internal Method: Make the end function call correctly"""
-        def wrapper(x: float) -> None:
-            func(x)
+        Frames that have been missed are merged into it
+        """
+        index = self._frame
+        while index < self._total and self._due(index+1) <= now:
+            index += 1
+        if index == self._frame:
+            return
+        self._frame = index
+        percentage = self.controller(index/self._total)
+        self._play(percentage - self._last_value)
+        if self.derivation:
+            self._last_value = percentage
+        if index == self._total:
+            self.stop()
             if self.end is not None:
                 self.end()
             if self.repeat != 0:
                 self.repeat -= 1
                 self.start()
-        return wrapper
+
+    def _play(self, value: float) -> None:
+        """Internal Method: Play a frame"""
+        self.callback(value)
 
     def start(self, *, delay: int = 0) -> None:
         """
@@ -66,26 +170,17 @@ class Animation:
 
         * `delay`: the delay before the animation starts
         """
-        self._tasks.clear()
-        last_value: float = 0
-        for i in range(1, self._total+1):
-            delay += self._delay + (i < self._leave)
-            percentage = self.controller(i/self._total)
-            self._tasks.append(
-                tkinter.Misc.after(
-                    tkinter._default_root, delay,
-                    self._wrapper(
-                        self.callback) if i == self._total else self.callback,
-                    percentage - last_value
-                )
-            )
-            if self.derivation:
-                last_value = percentage
+        self.stop()
+        self._clock = _get_clock(tkinter._default_root)
+        self._start = time.perf_counter()*1000 + delay
+        self._frame = 0
+        self._last_value = 0
+        self._clock.add(self)
 
     def stop(self) -> None:
         """Stop the animation"""
-        for task in self._tasks[::-1]:
-            tkinter.Misc.after_cancel(tkinter._default_root, task)
+        if self._clock is not None:
+            self._clock.remove(self)
 
 
 class MoveWidget(Animation):
@@ -183,8 +278,63 @@ class MoveItem(Animation):
         )
 
 
+_gradients: dict[tuple[tkinter.Canvas, int], dict[str, "Gradient"]] = {}
+
+
+def _stop_gradients(
+    canvas: tkinter.Canvas,
+    item: int,
+    options: typing.Iterable[str] | None = None,
+) -> None:
+    """
+    Internal Function: Stop the gradients running on an item
+
+    * `canvas`: canvas object to which the item belongs
+    * `item`: the item
+    * `options`: the options of the item, default value means all of them
+    """
+    if (gradients := _gradients.get((canvas, item))) is None:
+        return
+    for option in tuple(gradients) if options is None else options:
+        if (gradient := gradients.get(option)) is not None:
+            gradient.stop()
+
+
+@functools.lru_cache(maxsize=256)
+def _color_frames(
+    first: str,
+    second: str,
+    total: int,
+    controller: typing.Callable[[float], float],
+    derivation: bool = False,
+) -> tuple[str, ...]:
+    """
+    Internal Function: Get the color strings of all frames of a gradient
+
+    The return value of this function is cached
+
+    * `first`: start color
+    * `second`: stop color
+    * `total`: the number of frames
+    * `controller`: control function
+    * `derivation`: whether the values of the frames are derivative
+    """
+    first_rgb, second_rgb = rgb.str_to_rgb(first), rgb.str_to_rgb(second)
+    percentages = [controller(i/total) for i in range(total+1)]
+    if derivation:
+        values = [b - a for a, b in zip(percentages, percentages[1:])]
+    else:
+        values = percentages[1:]
+    return tuple(rgb.rgb_to_str(rgb.convert(first_rgb, second_rgb, value)) for value in values)
+
+
 class Gradient(Animation):
-    """Animation for color gradients"""
+    """
+    Animation for color gradients
+
+    Only one gradient runs on an option of an item at a time. Starting a new one
+    stops the old one, and the new one starts from the color the old one has reached
+    """
 
     def __init__(
         self,
@@ -211,16 +361,45 @@ class Gradient(Animation):
         * `repeat`: the number of times the entire animation is repeated
         * `fps`: the frame rate of the animation
         * `derivation`: whether the callback function is derivative
+
+        The colors of all frames are computed once, when the gradient is created
         """
         if not all(delta):
             raise ValueError("Null characters cannot be parsed")
+        self._canvas = canvas
+        self._item = item
+        self._option = option
+        self._delta = delta
+        self._color = delta[0]
         Animation.__init__(
-            self, ms, controller,
-            callback=lambda p: canvas.itemconfigure(
-                item, **{option: rgb.rgb_to_str(rgb.convert(
-                    rgb.str_to_rgb(delta[0]), rgb.str_to_rgb(delta[1]), p))}),
+            self, ms, controller, callback=self._set_color,
             end=end, repeat=repeat, fps=fps, derivation=derivation,
         )
+        self._colors = _color_frames(
+            *delta, self._total, controller, derivation)
+
+    def _set_color(self, _: float) -> None:
+        """Set the color of the item to the color of the current frame"""
+        self._color = self._colors[self._frame-1]
+        self._canvas.itemconfigure(self._item, **{self._option: self._color})
+
+    def start(self, *, delay: int = 0) -> None:
+        Animation.start(self, delay=delay)
+        gradients = _gradients.setdefault((self._canvas, self._item), {})
+        if (old := gradients.get(self._option)) is not None and old is not self:
+            old.stop()
+            self._delta = old._color, self._delta[1]
+            self._colors = _color_frames(
+                *self._delta, self._total, self.controller, self.derivation)
+        gradients[self._option] = self
+
+    def stop(self) -> None:
+        Animation.stop(self)
+        key = self._canvas, self._item
+        if (gradients := _gradients.get(key)) is not None and gradients.get(self._option) is self:
+            del gradients[self._option]
+            if not gradients:
+                del _gradients[key]
 
 
 class ScaleFontSize(Animation):
@@ -251,7 +430,7 @@ class ScaleFontSize(Animation):
         self._text = text
         if isinstance(delta, numbers.Number):
             delta = -abs(delta)
-            delta = text.font.cget("size"), delta-text.font.cget("size")
+            delta = text._font_key[1], delta-text._font_key[1]
         else:
             delta = -abs(delta[0]), -abs(delta[1])
             delta = delta[0], delta[1] - delta[0]
@@ -263,5 +442,6 @@ class ScaleFontSize(Animation):
 
     def _scale(self, size: int) -> None:
         """Scale font size"""
-        self._text.font.config(size=size)
+        self._text.set_font(size=size)
         self._text.update()
+        self._text.widget._reindex()
@@ -1,5 +1,6 @@
 """Color mapping table"""
 
+import functools
 import tkinter
 
 COLOR_MAP: dict[str, tuple[int, int, int]] = {
@@ -766,8 +767,13 @@ COLOR_MAP: dict[str, tuple[int, int, int]] = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def name_to_rgb(__color_name: str, /) -> tuple[int, int, int]:
-    """Convert a color name to RGB code"""
+    """
+    Convert a color name to RGB code
+
+    The return value of this function is cached, including the one obtained from Tk
+    """
     rgb = COLOR_MAP.get(__color_name.lower())
     if rgb is None:
         return tkinter.Misc.winfo_rgb(tkinter._default_root, __color_name)
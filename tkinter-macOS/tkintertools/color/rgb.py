@@ -1,11 +1,20 @@
 """Support for RGB codes"""
 
+import functools
+import json
+import pathlib
 import statistics
+import tkinter
 import typing
 
 from ..animation import controllers
 from . import colormap
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 RGB = tuple[int, int, int]
 
 
@@ -86,6 +95,72 @@ def gradient(
     return rgb_list
 
 
+def convert_array(
+    first: "typing.Sequence[RGB] | numpy.ndarray",
+    second: "typing.Sequence[RGB] | numpy.ndarray",
+    rate: "float | typing.Sequence[float] | numpy.ndarray",
+    *,
+    channel: tuple[bool, bool, bool] = (True, True, True),
+) -> "list[RGB] | numpy.ndarray":
+    """
+    Convert many colors to others proportionally in one call
+
+    * `first`: first colors
+    * `second`: second colors
+    * `rate`: conversion rate, or a conversion rate for each color
+    * `channel`: three color channels
+
+    When NumPy is available, the return value is an array of shape (N, 3),
+    otherwise it is a list of RGB codes
+    """
+    if numpy is not None:
+        first = numpy.asarray(first, dtype=numpy.int64).reshape(-1, 3)
+        delta = numpy.asarray(second, dtype=numpy.int64).reshape(-1, 3) - first
+        rate = numpy.asarray(rate, dtype=numpy.float64)
+        if rate.ndim:
+            rate = rate[:, None]
+        return first + numpy.rint(delta*rate*numpy.asarray(channel)).astype(numpy.int64)
+    if isinstance(rate, (int, float)):
+        return [convert(a, b, rate, channel=channel) for a, b in zip(first, second)]
+    return [convert(a, b, r, channel=channel) for a, b, r in zip(first, second, rate)]
+
+
+def blend_array(
+    colors: "typing.Sequence[typing.Sequence[RGB]] | numpy.ndarray",
+    *,
+    weights: list[float] | None = None,
+) -> "list[RGB] | numpy.ndarray":
+    """
+    Mix many groups of colors by weight in one call
+
+    * `colors`: groups of colors, each of which has the same number of colors
+    * `weights`: weight list, shared by all groups
+
+    When NumPy is available, the return value is an array of shape (N, 3),
+    otherwise it is a list of RGB codes
+    """
+    if numpy is not None:
+        colors = numpy.asarray(colors, dtype=numpy.float64)
+        if not len(colors):  # No groups
+            return numpy.empty((0, 3), dtype=numpy.int64)
+        if weights is None:  # Same weights
+            return numpy.rint(colors.mean(axis=1)).astype(numpy.int64)
+        weights = numpy.asarray(weights, dtype=numpy.float64)
+        weights = weights / weights.sum()
+        return numpy.rint(numpy.einsum("nmc,m->nc", colors, weights)).astype(numpy.int64)
+    return [blend(group, weights=weights) for group in colors]
+
+
+def rgb_to_str_array(colors: "typing.Sequence[RGB] | numpy.ndarray") -> list[str]:
+    """Convert many RGB codes to color strings in one call"""
+    if numpy is not None and isinstance(colors, numpy.ndarray):
+        colors = colors.reshape(-1, 3)
+        values = (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+        return [f"#{value:06X}" for value in values.tolist()]
+    return ["#%02X%02X%02X" % tuple(color) for color in colors]
+
+
+@functools.lru_cache(maxsize=4096)
 def _str_to_rgba(__c: str, *, refer: str) -> RGB:
     """Experimental: Convert color strings(RGBA) to RGB codes"""
     hex, a = divmod(int(__c[1:], 16), 256)
@@ -95,8 +170,13 @@ def _str_to_rgba(__c: str, *, refer: str) -> RGB:
     return convert((r, g, b), refer_rgb, 1 - a/255)
 
 
+@functools.lru_cache(maxsize=4096)
 def str_to_rgb(__c: str, /) -> RGB:
-    """Convert color strings to RGB codes"""
+    """
+    Convert color strings to RGB codes
+
+    The return value of this function is cached
+    """
     if __c.startswith("#"):  # HEX
         hex, b = divmod(int(__c[1:], 16), 256)
         r, g = divmod(hex, 256)
@@ -109,6 +189,41 @@ def rgb_to_str(rgb: RGB) -> str:
     return f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
 
 
+def preload(path: str | pathlib.Path, /) -> int:
+    """
+    Parse all the colors used by the style files of a theme folder in advance,
+    so that they are already in the cache when they are used, and return the number of them
+
+    * `path`: path to the theme folder
+    """
+    colors: set[str] = set()
+
+    def _collect(data: typing.Any) -> None:
+        if isinstance(data, dict):
+            for value in data.values():
+                _collect(value)
+        elif isinstance(data, str) and data:
+            colors.add(data)
+
+    for file in pathlib.Path(path).rglob("*.json"):
+        with open(file, "r", encoding="utf-8") as data:
+            _collect(json.load(data))
+
+    count = 0
+    for color in colors:
+        if color.startswith("#") and len(color) == 9:  # RGBA needs a reference color
+            continue
+        if not color.startswith("#") and color.lower() not in colormap.COLOR_MAP \
+                and tkinter._default_root is None:  # Tk is needed to parse it
+            continue
+        try:
+            str_to_rgb(color)
+        except (ValueError, tkinter.TclError):
+            continue
+        count += 1
+    return count
+
+
 def _str_to_hex(
     __color: str,
     /,
@@ -46,11 +46,13 @@ Structure of Class:
 """
 
 import abc
-import copy
+import contextlib
 import ctypes
+import itertools
 import math
 import pathlib
 import platform
+import time
 import tkinter
 import tkinter.font as font
 import typing
@@ -366,6 +368,109 @@ class _Trigger:
             self._command(*args, **kwargs)
 
 
+class _SpatialIndex:
+    """
+    Internal Class: A uniform grid that maps areas of a `Canvas` to its widgets
+
+    It is used to find out quickly which widgets may be under the mouse pointer
+    """
+
+    def __init__(self, size: int = 64) -> None:
+        """
+        * `size`: the side length of each cell of the grid
+        """
+        self.size = size
+        self._cells: dict[tuple[int, int], set[Widget]] = {}
+        self._keys: dict[Widget, list[tuple[int, int]]] = {}
+
+    def _span(self, region: tuple[float, float, float, float]) -> list[tuple[int, int]]:
+        """Internal Method: Get the keys of all cells covered by the region"""
+        x1, y1, x2, y2 = (math.floor(value / self.size) for value in region)
+        return [(i, j) for i in range(x1, x2+1) for j in range(y1, y2+1)]
+
+    def insert(self, widget: "Widget", region: tuple[float, float, float, float]) -> None:
+        """
+        Insert a widget into the grid, or refresh its position if it already exists
+
+        * `widget`: the widget
+        * `region`: the decision region of the widget
+        """
+        self.remove(widget)
+        self._keys[widget] = keys = self._span(region)
+        for key in keys:
+            self._cells.setdefault(key, set()).add(widget)
+
+    def remove(self, widget: "Widget") -> None:
+        """Remove a widget from the grid"""
+        for key in self._keys.pop(widget, ()):
+            cell = self._cells[key]
+            cell.discard(widget)
+            if not cell:
+                del self._cells[key]
+
+    def __contains__(self, widget: "Widget") -> bool:
+        return widget in self._keys
+
+    def query_region(self, region: tuple[float, float, float, float]) -> set["Widget"]:
+        """Return the widgets whose cells overlap the cells of the region"""
+        widgets: set[Widget] = set()
+        for key in self._span(region):
+            widgets.update(self._cells.get(key, ()))
+        return widgets
+
+    def query(self, x: float, y: float) -> set["Widget"]:
+        """Return the widgets whose cells contain the specified coordinates"""
+        if math.isnan(x) or math.isnan(y):
+            return set()
+        return set(self._cells.get((math.floor(x / self.size), math.floor(y / self.size)), ()))
+
+
+class _Metrics:
+    """
+    Internal Class: Cache of the measurements of a font
+
+    It has to be discarded once the font is configured
+    """
+
+    def __init__(self, font_: font.Font, limit: int = 1024) -> None:
+        """
+        * `font_`: the font to measure
+        * `limit`: the maximum number of strings to cache
+        """
+        self.font = font_
+        self.size: int = font_.cget("size")
+        self.linespace: int = font_.metrics("linespace")
+        self.limit = limit
+        self._widths: dict[str, int] = {}
+        self._chars: dict[str, int] = {}
+
+    def measure(self, text: str) -> int:
+        """Return the width of the text"""
+        if (width := self._widths.get(text)) is None:
+            if len(self._widths) >= self.limit:
+                self._widths.clear()
+            width = self._widths[text] = self.font.measure(text)
+        return width
+
+    def char(self, char: str) -> int:
+        """Return the width of a single character"""
+        if (width := self._chars.get(char)) is None:
+            width = self._chars[char] = self.font.measure(char)
+        return width
+
+    def width(self, text: str) -> int:
+        """Return the width of the text, added up by the widths of characters"""
+        return sum(map(self.char, text))
+
+    def prefix(self, text: str) -> list[int]:
+        """Return the widths of all prefixes of the text, added up by the widths of characters"""
+        return list(itertools.accumulate(map(self.char, text), initial=0))
+
+
+_BATCH_PROC = "proc ::_tkt_batch {cmds} {foreach cmd $cmds {{*}$cmd}}"
+"""Tcl procedure that runs a list of commands, each one given as a list of its words"""
+
+
 class Canvas(tkinter.Canvas):
     """
     Scalable Canvas
@@ -381,6 +486,11 @@ class Canvas(tkinter.Canvas):
         zoom_item: bool = False,
         keep_ratio: typing.Literal["min", "max", "full"] | None = None,
         free_anchor: bool = False,
+        motion_fps: int | None = None,
+        resize: typing.Literal["immediate", "deferred"] = "immediate",
+        resize_delay: int = 150,
+        scrollable: bool = False,
+        lazy: bool = False,
         **kw,
     ) -> None:
         """
@@ -390,8 +500,21 @@ class Canvas(tkinter.Canvas):
         * `keep_ratio`: the mode of aspect ratio, `min` follows the minimum value,
         `max` follows the maximum value, and `full` follows the maximum possible value
         * `free_anchor`: whether the anchor point is free-floating
+        * `motion_fps`: the maximum number of times per second that mouse motion is dispatched,
+        only the latest motion event is kept in between, it must be positive; default value means
+        no coalescing
+        * `resize`: the strategy of zooming items when the size changes, `immediate` zooms everything
+        at once, and `deferred` only scales the geometry of the items and zooms the fonts and widgets
+        once the size has been stable for a while
+        * `resize_delay`: the time (ms) that the size has to be stable in `deferred` mode
+        * `scrollable`: whether the view can be scrolled, the widgets out of view are hidden and
+        left out of events, theme switches and zooming until they come into view
+        * `lazy`: whether the items of widgets are only created when the widgets come into view,
+        or when they are realized explicitly
         * `**kw`: compatible with other parameters of class `tkinter.Canvas`
         """
+        if motion_fps is not None and not motion_fps > 0:
+            raise ValueError(f"motion_fps must be positive or None, got {motion_fps!r}")
         tkinter.Canvas.__init__(self, master, **kw)
 
         self._initial_size: tuple[int, int] = [None, None]
@@ -404,13 +527,51 @@ class Canvas(tkinter.Canvas):
         self._widgets: list[Widget] = []
         self._items: list[int] = []
         self._texts: dict[int, list[font.Font | int]] = {}
+        self._fonts: dict[tuple[str, int, str, str, bool, bool], font.Font] = {}
+        self._font_users: dict[tuple[str, int, str, str, bool, bool], int] = {}
+        self._text_fonts: dict[int, tuple] = {}
+        self._font_scale: float = 1.
+        self._metrics: dict[str, _Metrics] = {}
         self._images: dict[int, list[Image]] = {}
+        self._item_options: dict[int, tuple[tuple[str, str], ...]] = {}
+
+        self._index = _SpatialIndex()
+        self._awake: set[Widget] = set()
+        self._hovered: set[Widget] = set()
+        self._counter = itertools.count()
 
         self._expand = expand
         self._zoom_item = zoom_item
         self._free_anchor = free_anchor
         self._keep_ratio = keep_ratio
 
+        self._motion_fps = motion_fps
+        self._motion: tuple[tkinter.Event, str] | None = None
+        self._motion_job: str | None = None
+        self._motion_time: float = 0
+
+        self._resize = resize
+        self._resize_delay = resize_delay
+        self._resize_ratio: list[float] = [1., 1.]
+        self._resize_job: str | None = None
+
+        self._scrollable = scrollable
+        self._viewport: list[float] = [0, 0]
+        self._culled: dict[Widget, list] = {}
+        self._stale: set[Widget] = set()
+
+        self._lazy = lazy
+        self._unrealized: dict[Widget, None] = {}
+        self._realize_job: str | None = None
+        self._realize_view_job: str | None = None
+
+        self._batch: list[tuple] = []
+        self._batch_depth: int = 0
+        self.tk.eval(_BATCH_PROC)
+
+        self._theme_job: str | None = None
+        self._theme_transition: theme._Transition | None = None
+
         self.trigger_config = _Trigger(self._config)
         self.trigger_focus = _Trigger(self.focus)
 
@@ -434,10 +595,10 @@ class Canvas(tkinter.Canvas):
         self.bind("<Button-2>", lambda event: self._click(event, "center"))
         self.bind("<Button-3>", lambda event: self._click(event, "right"))
 
-        self.bind("<Motion>", lambda event: self._move(event, "none"))
-        self.bind("<B1-Motion>", lambda event: self._move(event, "left"))
-        self.bind("<B2-Motion>", lambda event: self._move(event, "center"))
-        self.bind("<B3-Motion>", lambda event: self._move(event, "right"))
+        self.bind("<Motion>", lambda event: self._motion_coalesce(event, "none"))
+        self.bind("<B1-Motion>", lambda event: self._motion_coalesce(event, "left"))
+        self.bind("<B2-Motion>", lambda event: self._motion_coalesce(event, "center"))
+        self.bind("<B3-Motion>", lambda event: self._motion_coalesce(event, "right"))
 
         self.bind("<ButtonRelease-1>",
                   lambda event: self._release(event, "left"))
@@ -461,14 +622,63 @@ class Canvas(tkinter.Canvas):
         self["insertbackground"] = "#FFFFFF" if dark else "#000000"
         for canvas in self._canvases:
             canvas._theme(dark)
-        for widget in self._widgets:
-            for component in widget.shapes + widget.texts + widget.images:
-                if styles := parser.get(widget, component):
-                    component.styles = styles
-            if widget._before_disabled:
-                widget.disabled()
+        self._theme_cancel()
+        transition = theme._transition
+        if transition.budget is None:
+            with self.batch():
+                for widget in self._widgets:
+                    self._theme_widget(widget)
+            return
+        visible = self._index.query_region(self._view_region())
+        widgets = [widget for widget in self._widgets if widget in visible] + \
+            [widget for widget in self._widgets if widget not in visible]
+        self._theme_transition = transition
+        transition.hold()
+        self._theme_step(iter(widgets), transition.budget)
+
+    def _theme_step(self, widgets: typing.Iterator["Widget"], budget: float) -> None:
+        """Internal Method: Apply the theme to the widgets until the time budget (ms) runs out"""
+        deadline = time.perf_counter() + budget/1000
+        with self.batch():
+            for widget in widgets:
+                if widget in self._index:  # Not destroyed yet
+                    self._theme_widget(widget)
+                if time.perf_counter() >= deadline:
+                    break
             else:
-                widget.update()
+                self._theme_job = None
+                self._theme_transition, transition = None, self._theme_transition
+                return transition.release()
+        self._theme_job = self.after(
+            1, lambda: self._theme_step(widgets, budget))
+
+    def _theme_cancel(self, superseded: bool = True) -> None:
+        """
+        Internal Method: Cancel the theme switch in progress, if any
+
+        * `superseded`: whether a newer theme switch replaces it, in which case the callback
+        function of the cancelled switch is dropped, since that theme is never fully applied
+        """
+        if self._theme_job is not None:
+            self.after_cancel(self._theme_job)
+            self._theme_job = None
+            self._theme_transition, transition = None, self._theme_transition
+            if superseded and transition is not theme._transition:
+                transition.cancel()
+            else:  # Restarted by the same switch, or the Canvas is destroyed
+                transition.release()
+
+    def _theme_widget(self, widget: "Widget") -> None:
+        """Internal Method: Apply the current theme to a widget"""
+        if widget in self._culled:  # Applied when it comes into view
+            return self._stale.add(widget)
+        for component in widget.shapes + widget.texts + widget.images:
+            if styles := parser.get(widget, component):
+                component.styles = styles
+        if widget._before_disabled:
+            widget.disabled()
+        else:
+            widget.update()
 
     def get_canvases(self) -> tuple["Canvas", ...]:
         """Retrun all child `Canvas` of the `Canvas`"""
@@ -536,6 +746,7 @@ class Canvas(tkinter.Canvas):
         """Internal Method: Scale the `Canvas` itself, and return its own relative scale"""
         if self._initial_size == [None, None]:
             self._zoom_init()
+        view = self._view_region()
         last_ratio = self._size[:]
         self._position = [self.winfo_x(), self.winfo_y()]
         self._size = [self.winfo_width(), self.winfo_height()]
@@ -545,68 +756,365 @@ class Canvas(tkinter.Canvas):
         if self._zoom_item:
             relative_ratio = self._size[0] / \
                 last_ratio[0], self._size[1] / last_ratio[1]
-            self._zoom_widgets(relative_ratio)
-            self._zoom_items(relative_ratio)
-            self._zoom_texts(relative_ratio)
-            self._zoom_images(relative_ratio)
+            if self._resize == "deferred":
+                self._zoom_items(relative_ratio)
+                self._resize_ratio[0] *= relative_ratio[0]
+                self._resize_ratio[1] *= relative_ratio[1]
+                if self._resize_job is not None:
+                    self.after_cancel(self._resize_job)
+                self._resize_job = self.after(
+                    self._resize_delay, self._resize_flush)
+            else:
+                self._zoom_items(relative_ratio)  # The view is scaled first for culling the widgets
+                self._zoom_texts(relative_ratio)
+                self._zoom_images(relative_ratio)
+                self._zoom_widgets(relative_ratio)  # The fonts are zoomed first for refitting the texts
+                view = (view[0]*relative_ratio[0], view[1]*relative_ratio[1],
+                        view[2]*relative_ratio[0], view[3]*relative_ratio[1])
+
+        if self._scrollable:
+            self._cull_view(view)
+        if self._unrealized:
+            self._realize_view()
 
         for canvas in self._canvases:
             canvas._zoom()
 
+    def _resize_flush(self) -> None:
+        """Internal Method: Zoom the fonts and the widgets by the ratio accumulated in `deferred` mode"""
+        if self._resize_job is None:
+            return
+        self.after_cancel(self._resize_job)
+        self._resize_job = None
+        relative_ratio, self._resize_ratio = tuple(self._resize_ratio), [1., 1.]
+        self._zoom_texts(relative_ratio)
+        self._zoom_images(relative_ratio)
+        self._zoom_widgets(relative_ratio)
+        if self._scrollable:
+            self._cull_view(self._view_region())
+
     def _zoom_widgets(self, relative_ratio: tuple[float, float]) -> None:
         """Internal Method: Modify data for the position and size of the widgets"""
         for widget in self._widgets:
-            widget.w *= relative_ratio[0]
-            widget.h *= relative_ratio[1]
-            widget.x *= relative_ratio[0]
-            widget.y *= relative_ratio[1]
+            if (culled := self._culled.get(widget)) is not None:  # Zoomed when it comes into view
+                culled[0] *= relative_ratio[0]
+                culled[1] *= relative_ratio[1]
+                x1, y1, x2, y2 = culled[2]
+                culled[2] = (x1*relative_ratio[0], y1*relative_ratio[1],
+                             x2*relative_ratio[0], y2*relative_ratio[1])
+                self._index.insert(widget, culled[2])
+                continue
+            self._zoom_widget(widget, relative_ratio)
+            widget._reindex()
+
+    def _zoom_widget(self, widget: "Widget", relative_ratio: tuple[float, float]) -> None:
+        """Internal Method: Modify data for the position and size of a widget"""
+        widget.w *= relative_ratio[0]
+        widget.h *= relative_ratio[1]
+        widget.x *= relative_ratio[0]
+        widget.y *= relative_ratio[1]
+        for component in widget.shapes + widget.texts + widget.images:
+            component.w *= relative_ratio[0]
+            component.h *= relative_ratio[1]
+            component.x *= relative_ratio[0]
+            component.y *= relative_ratio[1]
+        for text in widget.texts:
+            text._refit()
+
+    def _view_region(self) -> tuple[float, float, float, float]:
+        """Internal Method: Return the region of the `Canvas` in view"""
+        if self._size[0] is None:
+            w, h = self.winfo_width(), self.winfo_height()
+        else:
+            w, h = self._size
+        return self._viewport[0], self._viewport[1], self._viewport[0] + w, self._viewport[1] + h
+
+    def _cull(self, widget: "Widget", region: tuple[float, float, float, float]) -> None:
+        """
+        Internal Method: Hide a widget that is out of view, or display it again when it comes into view
+
+        * `widget`: the widget
+        * `region`: the current decision region of the widget
+        """
+        x1, y1, x2, y2 = self._view_region()
+        if region[0] <= x2 and region[2] >= x1 and region[1] <= y2 and region[3] >= y1:
+            if (culled := self._culled.pop(widget, None)) is None:
+                return
+            if culled[0] != 1 or culled[1] != 1:
+                self._zoom_widget(widget, culled[:2])
+                self._index.insert(widget, widget.region())
+            self._set_items_state(widget, "normal")
+            if widget in self._stale:
+                self._stale.discard(widget)
+                self._theme_widget(widget)
+        elif (culled := self._culled.get(widget)) is not None:
+            culled[2] = region
+        else:
+            if widget in self._hovered:  # Otherwise it comes back into view still hovered
+                self._hovered.discard(widget)
+                event = tkinter.Event()
+                event.x = event.y = math.nan
+                widget.feature._leave(event)
+            self._culled[widget] = [1., 1., region]
+            self._set_items_state(widget, "hidden")
+
+    def _cull_view(self, last_view: tuple[float, float, float, float]) -> None:
+        """Internal Method: Hide or display the widgets that are in the last view or in the current view"""
+        for widget in self._index.query_region(last_view) | self._index.query_region(self._view_region()):
+            if (culled := self._culled.get(widget)) is not None:
+                self._cull(widget, culled[2])
+            else:
+                self._cull(widget, widget.region())
+
+    def _set_items_state(self, widget: "Widget", state: typing.Literal["normal", "hidden"]) -> None:
+        """Internal Method: Set the state of all items of a widget"""
+        with self.batch():
             for component in widget.shapes + widget.texts + widget.images:
-                component.w *= relative_ratio[0]
-                component.h *= relative_ratio[1]
-                component.x *= relative_ratio[0]
-                component.y *= relative_ratio[1]
+                for item in component.items:
+                    self._itemconfigure_batched(item, state=state)
+
+    def scroll(self, dx: float = 0, dy: float = 0) -> None:
+        """
+        Scroll the view of a scrollable `Canvas`
+
+        * `dx`: the distance to scroll horizontally
+        * `dy`: the distance to scroll vertically
+        """
+        self.scroll_to(self._viewport[0] + dx, self._viewport[1] + dy)
+
+    def _extent(self) -> tuple[float, float]:
+        """Internal Method: Return the right and bottom sides of the content, including the widgets out of view"""
+        x2, y2 = 0, 0
+        if bbox := self.bbox("all"):  # Hidden items are not included
+            x2, y2 = bbox[2], bbox[3]
+        for culled in self._culled.values():
+            x2, y2 = max(x2, culled[2][2]), max(y2, culled[2][3])
+        for widget in self._unrealized:
+            region = widget.region()
+            x2, y2 = max(x2, region[2]), max(y2, region[3])
+        return x2, y2
+
+    def scroll_to(self, x: float, y: float) -> None:
+        """
+        Scroll the view of a scrollable `Canvas` so that its top left corner is at the position,
+        which is kept between the top left corner and the bottom right side of the content
+
+        * `x`: the x-coordinate of the top left corner of the view
+        * `y`: the y-coordinate of the top left corner of the view
+        """
+        if not self._scrollable:
+            return
+        view = self._view_region()
+        x2, y2 = self._extent()  # The view does not go past the content
+        dx = round(max(0, min(x, x2 - view[2] + view[0])) - self._viewport[0])
+        dy = round(max(0, min(y, y2 - view[3] + view[1])) - self._viewport[1])
+        if not (dx or dy):
+            return
+        self.scan_mark(0, 0)
+        self.scan_dragto(-dx, -dy, gain=1)
+        self._viewport[0] += dx
+        self._viewport[1] += dy
+        self._cull_view(view)
+        if self._unrealized:
+            self._realize_view()
+
+    def _realize_view(self) -> None:
+        """Internal Method: Realize the widgets in view that are not realized yet"""
+        if self._realize_view_job is not None:
+            self.after_cancel(self._realize_view_job)
+            self._realize_view_job = None
+        with self.batch():
+            for widget in sorted(self._index.query_region(self._view_region()).intersection(
+                    self._unrealized), key=lambda widget: widget._order):
+                widget.realize()
+
+    def _realize_idle(self) -> None:
+        """Internal Method: Realize the widgets in view once idle, if the `Canvas` is already displayed"""
+        if self._size[0] is not None and self._realize_view_job is None:
+            self._realize_view_job = self.after_idle(self._realize_view)
+
+    def realize_all(
+        self,
+        budget: float = 8,
+        callback: typing.Callable[[], typing.Any] | None = None,
+    ) -> None:
+        """
+        Realize all the widgets that are not realized yet, spread over idle callbacks
+
+        * `budget`: the maximum time (ms) spent on realizing widgets per callback
+        * `callback`: the function that is called when all widgets are realized
+        """
+        if self._realize_job is not None:
+            self.after_cancel(self._realize_job)
+        self._realize_job = self.after_idle(self._realize_step, budget, callback)
+
+    def _realize_step(self, budget: float, callback: typing.Callable[[], typing.Any] | None) -> None:
+        """Internal Method: Realize widgets until the time budget (ms) runs out"""
+        deadline = time.perf_counter() + budget/1000
+        with self.batch():
+            while self._unrealized and time.perf_counter() < deadline:
+                next(iter(self._unrealized)).realize()
+        if self._unrealized:
+            self._realize_job = self.after_idle(self._realize_step, budget, callback)
+            return
+        self._realize_job = None
+        if callback is not None:
+            callback()
 
     def _zoom_items(self, relative_ratio: tuple[float, float]) -> None:
-        """Internal Method: Scale the items"""
-        for item in self.find_all():
-            self.scale(item, 0, 0, *relative_ratio)
+        """Internal Method: Scale the items, and the view of a scrollable `Canvas` with them"""
+        self.scale("all", 0, 0, *relative_ratio)
+        if self._scrollable and (self._viewport[0] or self._viewport[1]):
+            x, y = self._viewport[0]*relative_ratio[0], self._viewport[1]*relative_ratio[1]
+            self.scan_mark(0, 0)
+            self.scan_dragto(round(self._viewport[0]) - round(x),
+                             round(self._viewport[1]) - round(y), gain=1)
+            self._viewport = [x, y]
 
     def _zoom_texts(self, relative_ratio: tuple[float, float]) -> None:
-        """Internal Method: Scale the texts"""
-        for text, value in self._texts.items():
-            value[0] *= math.sqrt(relative_ratio[0]*relative_ratio[1])
-            value[1].config(size=round(value[0]))
-            self.itemconfigure(text, font=value[1])
+        """
+        Internal Method: Scale the texts
+
+        Each font is a named font, so it is configured only once and all the texts using it follow
+        """
+        ratio = math.sqrt(relative_ratio[0]*relative_ratio[1])
+        self._font_scale *= ratio
+        self._metrics.clear()
+        sizes: dict[str, float] = {}
+        for key, font_ in self._fonts.items():
+            size = sizes[font_.name] = key[1] * self._font_scale
+            font_.config(size=round(size))
+        for value in self._texts.values():
+            if (size := sizes.get(value[1].name)) is None:
+                size = sizes[value[1].name] = value[0] * ratio
+                value[1].config(size=round(size))
+            value[0] = size
 
     def _zoom_images(self, relative_ratio: tuple[float, float]) -> None:
         """Internal Method: Scale the images"""
         # TODO: Complete this method
 
     def destroy(self) -> None:
+        if self._motion_job is not None:
+            self.after_cancel(self._motion_job)
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._theme_cancel(False)
+        if self._realize_job is not None:
+            self.after_cancel(self._realize_job)
+        if self._realize_view_job is not None:
+            self.after_cancel(self._realize_view_job)
+        self._culled.clear()
+        self._stale.clear()
         if _canvases := getattr(self.master, "_canvases", None):
             _canvases.remove(self)
         return tkinter.Canvas.destroy(self)
 
+    def _create(self, itemType: str, args: tuple, kw: dict[str, typing.Any]) -> int:
+        item = tkinter.Canvas._create(self, itemType, args, kw)
+        if tags := kw.get("tags"):
+            self._item_options[item] = self._parse_tags(tags)
+        return item
+
+    @staticmethod
+    def _parse_tags(tags: str | tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        """Internal Method: Pair up the tags of an item as (option of the item, key of the style)"""
+        if isinstance(tags, str):
+            tags = tags.split()
+        return tuple(zip(tags[0:-1:2], tags[1:len(tags):2]))
+
+    def _get_item_options(self, item: int) -> tuple[tuple[str, str], ...]:
+        """Internal Method: Get the option map of an item, which is recorded when it is created"""
+        if (options := self._item_options.get(item)) is None:
+            options = self._item_options[item] = self._parse_tags(
+                self.itemcget(item, "tags"))
+        return options
+
+    def _get_font(
+        self,
+        family: str,
+        size: int,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+    ) -> font.Font:
+        """
+        Internal Method: Get the font of the `Canvas` with the descriptor
+
+        Fonts with the same descriptor are shared, and the size of them follows the zoom of the `Canvas`.
+        Each call counts as a user of the font until `_release_font` is called with the same descriptor
+
+        * `size`: the size of the font before zooming
+        """
+        key = family, size, weight, slant, bool(underline), bool(overstrike)
+        if (font_ := self._fonts.get(key)) is None:
+            font_ = self._fonts[key] = font.Font(
+                family=family, size=round(size*self._font_scale), weight=weight,
+                slant=slant, underline=underline, overstrike=overstrike)
+        self._font_users[key] = self._font_users.get(key, 0) + 1
+        return font_
+
+    def _release_font(
+        self,
+        family: str,
+        size: int,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+    ) -> None:
+        """Internal Method: Give up a font got by `_get_font`, which is evicted once it has no users"""
+        key = family, size, weight, slant, bool(underline), bool(overstrike)
+        if (users := self._font_users.get(key, 0) - 1) > 0:
+            self._font_users[key] = users
+            return
+        self._font_users.pop(key, None)
+        if (font_ := self._fonts.pop(key, None)) is not None:
+            self._metrics.pop(font_.name, None)
+
+    def _get_metrics(self, font_: font.Font) -> _Metrics:
+        """Internal Method: Get the measurement cache of a font"""
+        if (metrics := self._metrics.get(font_.name)) is None:
+            metrics = self._metrics[font_.name] = _Metrics(font_)
+        return metrics
+
     def create_text(self, *args, **kw) -> int:
+        descriptor = None
         if not (font_ := kw.get("font")):
-            kw["font"] = font.Font(family=constants.FONT, size=constants.SIZE)
+            descriptor = constants.FONT, constants.SIZE
         elif isinstance(font_, str):
-            kw["font"] = font.Font(family=font_, size=constants.SIZE)
+            descriptor = font_, constants.SIZE
         elif isinstance(font_, int):
-            kw["font"] = font.Font(family=constants.FONT, size=-abs(font_))
+            descriptor = constants.FONT, -abs(font_)
         elif isinstance(font_, font.Font):
             kw["font"].config(size=-abs(font_.cget("size")))
+            self._metrics.pop(font_.name, None)
         else:
             font_ = list(font_)
-            font_[1] = -abs(font_[1])
             length = len(font_)
-            kw["font"] = font.Font(family=font_[0], size=font_[1],
-                                   weight=font_[2] if length > 2 else "normal",
-                                   slant=font_[3] if length > 3 else "roman")
+            descriptor = (font_[0], -abs(font_[1]), font_[2] if length > 2 else "normal",
+                          font_[3] if length > 3 else "roman")
+        if descriptor is not None:
+            kw["font"] = self._get_font(*descriptor)
         text = tkinter.Canvas.create_text(self, *args, **kw)
         self._texts[text] = [kw["font"].cget("size"), kw["font"]]
+        if descriptor is not None:  # Released when the item is deleted
+            self._text_fonts[text] = descriptor
         return text
 
+    def delete(self, *args: str | int) -> None:
+        """Delete items, and give up the pooled fonts of the texts among them"""
+        if not self._text_fonts:
+            return tkinter.Canvas.delete(self, *args)
+        items = [item for tagOrId in args for item in (
+            (tagOrId,) if isinstance(tagOrId, int) else self.find_withtag(tagOrId))]
+        tkinter.Canvas.delete(self, *args)
+        for item in items:
+            if (descriptor := self._text_fonts.pop(item, None)) is not None:
+                self._texts.pop(item, None)
+                self._release_font(*descriptor)
+
     def create_image(self, *args, **kw) -> int:
         image = tkinter.Canvas.create_image(self, *args, **kw)
         self._images[image] = [kw.get("image"), None]
@@ -619,6 +1127,81 @@ class Canvas(tkinter.Canvas):
             self._images[tagOrId] = [kw.get("image"), None]
         return tkinter.Canvas.itemconfigure(self, tagOrId, **kw)
 
+    def _targets(self, event: tkinter.Event) -> list["Widget"]:
+        """
+        Internal Method: Get the widgets that a mouse event should be dispatched to
+
+        Only the widgets near the mouse pointer and the widgets that are not at rest
+        (for example, hovered or pressed) are returned, from top to bottom. Widgets out of view
+        are left out unless they are not at rest, so that a focused one can still be blurred
+        """
+        self._resize_flush()
+        if self._scrollable:
+            event.x += self._viewport[0]
+            event.y += self._viewport[1]
+            widgets = self._index.query(
+                event.x, event.y).difference(self._culled) | self._awake
+        else:
+            widgets = self._index.query(event.x, event.y) | self._awake
+        if self._unrealized:
+            widgets.difference_update(self._unrealized)
+        return sorted(widgets, key=lambda widget: widget._order, reverse=True)
+
+    @contextlib.contextmanager
+    def batch(self) -> typing.Iterator[None]:
+        """
+        Collect the item configurations made in the context and run them
+        with a single Tcl call when leaving it
+
+        Nested batches are merged, and the commands are run when the outermost one exits.
+        The arguments are passed as Tcl objects, so they are never parsed as a script
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch:
+                commands, self._batch = tuple(self._batch), []
+                self.tk.call("::_tkt_batch", commands)
+
+    def _batch_call(self, *args: typing.Any) -> None:
+        """Internal Method: Call a subcommand of the `Canvas`, deferring it to the current batch if there is one"""
+        if not self._batch_depth:
+            return self.tk.call(self._w, *args)
+        self._batch.append((self._w, *args))
+
+    def _itemconfigure_batched(self, tagOrId: str | int, **kw) -> None:
+        """Internal Method: Configure an item, deferring it to the current batch if there is one"""
+        if kw:
+            self._batch_call("itemconfigure", tagOrId, *self._options(kw))
+
+    def _motion_coalesce(
+        self,
+        event: tkinter.Event,
+        type_: typing.Literal["left", "center", "right", "none"]
+    ) -> None:
+        """Internal Method: Keep the latest motion event and dispatch it at most `motion_fps` times per second"""
+        if self._motion_fps is None:
+            return self._move(event, type_)
+        self._motion = event, type_
+        if self._motion_job is None:
+            delay = 1000/self._motion_fps - (time.perf_counter()-self._motion_time)*1000
+            if delay > 0:
+                self._motion_job = self.after(round(delay), self._motion_flush)
+            else:
+                self._motion_job = self.after_idle(self._motion_flush)
+
+    def _motion_flush(self) -> None:
+        """Internal Method: Dispatch the pending motion event, if any"""
+        if self._motion_job is not None:
+            self.after_cancel(self._motion_job)
+            self._motion_job = None
+        if self._motion is not None:
+            (event, type_), self._motion = self._motion, None
+            self._motion_time = time.perf_counter()
+            self._move(event, type_)
+
     def _move(
         self,
         event: tkinter.Event,
@@ -626,10 +1209,26 @@ class Canvas(tkinter.Canvas):
     ) -> None:
         """Internal Method: Events to move the mouse"""
         self.trigger_config.reset()
-        for widget in self.get_widgets()[::-1]:
+        hovered: set[Widget] = set()
+        for widget in self._targets(event):
+            if (feature := widget.feature) is None:
+                continue
+            if feature.hover:
+                if flag := feature._detect(event):
+                    hovered.add(widget)
+                    self.trigger_config.update(cursor=feature.cursor)
+                    if widget not in self._hovered:
+                        feature._enter(event)
+                if type_ != "none":  # Dragging is delivered besides the hover protocol
+                    flag = getattr(feature, f"_move_{type_}")(event) or flag
+            else:
+                flag = getattr(feature, f"_move_{type_}")(event)
+            if flag and not widget.through:
+                event.x = math.nan
+        for widget in self._hovered - hovered:
             if widget.feature is not None:
-                if getattr(widget.feature, f"_move_{type_}")(event) and not widget.through:
-                    event.x = math.nan
+                widget.feature._leave(event)
+        self._hovered = hovered
         self.trigger_config.update(cursor="arrow")
 
     def _click(
@@ -638,9 +1237,10 @@ class Canvas(tkinter.Canvas):
         type_: typing.Literal["left", "center", "right"]
     ) -> None:
         """Internal Method: Events to active the mouse"""
+        self._motion_flush()
         self.focus_set()
         self.trigger_focus.reset()
-        for widget in self.get_widgets()[::-1]:
+        for widget in self._targets(event):
             if widget.feature is not None:
                 if getattr(widget.feature, f"_click_{type_}")(event) and not widget.through:
                     event.x = math.nan
@@ -652,7 +1252,8 @@ class Canvas(tkinter.Canvas):
         type_: typing.Literal["left", "center", "right"]
     ) -> None:
         """Internal Method: Events to release the mouse"""
-        for widget in self.get_widgets()[::-1]:
+        self._motion_flush()
+        for widget in self._targets(event):
             if widget.feature is not None:
                 if getattr(widget.feature, f"_release_{type_}")(event) and not widget.through:
                     event.x = math.nan
@@ -663,12 +1264,15 @@ class Canvas(tkinter.Canvas):
         type_: typing.Literal["up", "down"] | None = None
     ) -> None:
         """Internal Method: Events to scroll the mouse wheel"""
+        self._motion_flush()
         if type_ is not None:
             event.delta = 120 if type_ == "up" else -120
-        for widget in self.get_widgets()[::-1]:
+        for widget in self._targets(event):
             if widget.feature is not None:
                 if getattr(widget.feature, "_wheel")(event) and not widget.through:
                     event.x = math.nan
+        if self._scrollable and not math.isnan(event.x):  # Not consumed by any widget
+            self.scroll(0, -40 if event.delta > 0 else 40)
 
     def _input(self, event: tkinter.Event) -> None:
         """Internal Method: Events for typing"""
@@ -679,15 +1283,42 @@ class Canvas(tkinter.Canvas):
 
 
 class Feature(abc.ABC):
-    """Base Class: The features of a `Widget`"""
+    """
+    Base Class: The features of a `Widget`
+
+    A `Feature` can opt into the hover protocol by setting `hover` to True. On mouse
+    motion, the `Canvas` then hit-tests it with `_detect`, and calls `_enter` or `_leave`
+    when the mouse pointer crosses its boundary, instead of calling `_move_none`.
+    `_move_left`, `_move_center` and `_move_right` are still called while dragging
+    """
+
+    hover: bool = False
+    cursor: str = "arrow"
 
     def __init__(self, widget: "Widget") -> None:
         self.widget: Widget = widget
         widget.feature = self
 
+    def _detect(self, event: tkinter.Event) -> bool:
+        """Internal Method: Whether the mouse pointer is on the sensitive part of the widget"""
+        return False
+
+    def _enter(self, event: tkinter.Event) -> None:
+        """Internal Method: Event of the mouse pointer entering the widget"""
+
+    def _leave(self, event: tkinter.Event) -> None:
+        """Internal Method: Event of the mouse pointer leaving the widget"""
+
     def _move_none(self, event: tkinter.Event) -> bool:
         """Internal Method: Event of moving the mouse"""
-        return False
+        if not self.hover:
+            return False
+        if flag := self._detect(event):
+            self.widget.master.trigger_config.update(cursor=self.cursor)
+            self._enter(event)
+        else:
+            self._leave(event)
+        return flag
 
     def _move_left(self, event: tkinter.Event) -> bool:
         """Internal Method: Event of holding down the left mouse button to move the mouse"""
@@ -752,10 +1383,11 @@ class Component(abc.ABC):
         self.y = rel_position[1] + widget.y
         self.w, self.h = size if size else (widget.w, widget.h)
         self.name: str | None = name
-        self.styles = styles if styles else parser.get(widget, self)
+        self.styles = parser._freeze(styles) if styles else parser.get(widget, self)
         self.items: list[int] = []
         self.visible: bool = True
         self.animation = animation
+        self._disabled: dict[str, str] | None = None
         widget.register(self)
 
     def move(self, dx: float, dy: float) -> None:
@@ -772,6 +1404,9 @@ class Component(abc.ABC):
     def destroy(self) -> None:
         """Destroy the `Component`"""
         self.widget.master.delete(*self.items)
+        for item in self.items:
+            animations._stop_gradients(self.widget.master, item)
+            self.widget.master._item_options.pop(item, None)
 
     def center(self) -> tuple[int, int]:
         """Return the geometric center of the `Component`"""
@@ -796,45 +1431,48 @@ class Component(abc.ABC):
             state = self.widget.state
         if not self.visible:
             return
-        if self.styles.get(state) is not None:
-            self.configure(self.styles[state], no_delay=no_delay)
+        if (style := self.styles.get(state)) is None and state == "disabled":
+            style = self._disabled
+        if style is not None:
+            self.configure(style, no_delay=no_delay)
 
     def _get_disabled_style(self, refer_state: str = "normal") -> dict[str, str]:
         """"""
-        if self.styles.get("disabled") is None:
-            self.styles["disabled"] = copy.deepcopy(
-                self.styles.get(refer_state, {}))
-            for key, value in self.styles["disabled"].items():
-                self.styles["disabled"][key] = rgb.rgb_to_str(rgb.convert(
-                    rgb.str_to_rgb(value), rgb.str_to_rgb(self.widget.master["bg"]), 0.618))
-        return self.styles["disabled"]
+        if (style := self.styles.get("disabled")) is None:
+            style = self._disabled = parser._get_disabled(
+                tuple(self.styles.get(refer_state, {}).items()), self.widget.master["bg"])
+        return style
 
     def configure(self, style: dict[str, str], *, no_delay: bool = False) -> None:
         """Configure properties of the `Component` and update them immediately"""
-        for item in self.items:
-            tags = self.widget.master.itemcget(item, "tags").split()
-            kwargs = {key: value for key, param in zip(
-                tags[0:-1:2], tags[1:len(tags):2]) if (value := style.get(param)) is not None}
-            if self.widget.animation and self.animation and not no_delay:
-                for key, value in kwargs.items():
-                    start_color: str = self.widget.master.itemcget(item, key)
-                    if start_color.startswith("#") and len(start_color) == 9:
-                        start_color = rgb.rgb_to_str(rgb._str_to_rgba(
-                            start_color, refer=self.widget.master["bg"]))
-                    if value.startswith("#") and len(value) == 9:
-                        value = rgb.rgb_to_str(rgb._str_to_rgba(
-                            value, refer=self.widget.master["bg"]))
-                    if value == "" or start_color == "":  # Null characters cannot be parsed
-                        self.widget.master.itemconfigure(item, **{key: value})
-                    else:
-                        animations.Gradient(
-                            self.widget.master, item, key, 150, (start_color, value)).start()
-            else:
-                for key, value in kwargs.items():
-                    if value.startswith("#") and len(value) == 9:
-                        kwargs[key] = rgb.rgb_to_str(rgb._str_to_rgba(
-                            value, refer=self.widget.master["bg"]))
-                self.widget.master.itemconfigure(item, **kwargs)
+        with self.widget.master.batch():
+            for item in self.items:
+                kwargs = {key: value for key, param in self.widget.master._get_item_options(
+                    item) if (value := style.get(param)) is not None}
+                if self.widget.animation and self.animation and not no_delay:
+                    for key, value in kwargs.items():
+                        start_color: str = self.widget.master.itemcget(item, key)
+                        if start_color.startswith("#") and len(start_color) == 9:
+                            start_color = rgb.rgb_to_str(rgb._str_to_rgba(
+                                start_color, refer=self.widget.master["bg"]))
+                        if value.startswith("#") and len(value) == 9:
+                            value = rgb.rgb_to_str(rgb._str_to_rgba(
+                                value, refer=self.widget.master["bg"]))
+                        if value == "" or start_color == "":  # Null characters cannot be parsed
+                            animations._stop_gradients(
+                                self.widget.master, item, (key,))
+                            self.widget.master._itemconfigure_batched(
+                                item, **{key: value})
+                        else:
+                            animations.Gradient(
+                                self.widget.master, item, key, 150, (start_color, value)).start()
+                else:
+                    for key, value in kwargs.items():
+                        if value.startswith("#") and len(value) == 9:
+                            kwargs[key] = rgb.rgb_to_str(rgb._str_to_rgba(
+                                value, refer=self.widget.master["bg"]))
+                    animations._stop_gradients(self.widget.master, item, kwargs)
+                    self.widget.master._itemconfigure_batched(item, **kwargs)
 
     def appear(self, *, no_delay: bool = True) -> None:
         """"""
@@ -844,12 +1482,11 @@ class Component(abc.ABC):
     def disappear(self, *, no_delay: bool = True) -> None:
         """"""
         self.visible = False
-        temp_style = copy.deepcopy(self.styles.get(self.widget.state))
-        if temp_style is None:
+        if (style := self.styles.get(self.widget.state)) is None and self.widget.state == "disabled":
+            style = self._disabled
+        if style is None:
             return
-        for arg in temp_style:
-            temp_style[arg] = ""
-        self.configure(temp_style, no_delay=no_delay)
+        self.configure(dict.fromkeys(style, ""), no_delay=no_delay)
 
     def __getitem__(self, key: str) -> dict[str, str]:
         """"""
@@ -857,7 +1494,8 @@ class Component(abc.ABC):
 
     def __setitem__(self, key: str, value: dict[str, str]) -> None:
         """"""
-        self.styles[key].update(value)
+        self.styles = parser._freeze(
+            {**self.styles, key: {**self.styles[key], **value}})  # Copy on write
         self.update(no_delay=True)
 
     @abc.abstractmethod
@@ -909,30 +1547,58 @@ class Text(Component):
         self.limit: int = limit
         self.left: int = 0
         self.right: int = 0
-        self.font: font.Font = font.Font(
-            family=family if family else constants.FONT,
-            size=-abs(size if size else constants.SIZE),
-            weight=weight, slant=slant,
-            underline=underline, overstrike=overstrike)
+        self._size: float = -abs(size if size else constants.SIZE)
+        self._font_key = (family if family else constants.FONT, round(self._size),
+                          weight, slant, underline, overstrike)
+        self.font: font.Font = widget.master._get_font(*self._font_key)
         Component.__init__(self, widget, rel_position,
                            styles=styles, animation=animation)
 
     def region(self) -> tuple[int, int, int, int]:
         """Return the decision region of the `Text`"""
-        width_half = self.font.measure(self.value)/2
-        height_half = -self.font.cget("size") / 2
+        metrics = self.widget.master._get_metrics(self.font)
+        width_half = metrics.measure(self.value)/2
+        height_half = -metrics.size / 2
         x, y = self.center()
         return x-width_half, y-height_half, x+width_half, y+height_half
 
+    def set_font(self, **kw) -> None:
+        """
+        Change the font of the `Text`, the font itself is shared and is not modified
+
+        * `**kw`: the options of the font to change, which are `family`, `size`, `weight`,
+        `slant`, `underline` and `overstrike`; a fractional size is kept and only rounded for the font
+        """
+        if (size := kw.get("size")) is not None:
+            self._size = size
+            kw["size"] = round(size)
+        font_key = tuple(kw.get(option, value) for option, value in zip(
+            ("family", "size", "weight", "slant", "underline", "overstrike"), self._font_key))
+        if font_key == self._font_key:
+            return
+        self._font_key, last_key = font_key, self._font_key
+        self.font = self.widget.master._get_font(*self._font_key)
+        for item in self.items:
+            self.widget.master._texts[item] = [self.font.cget("size"), self.font]
+            self.widget.master.itemconfigure(item, font=self.font)
+        self.widget.master._release_font(*last_key)
+
     def zoom(self, ratio: tuple[float, float]) -> None:
         """Scale the text"""
+        self.set_font(size=self._size*math.sqrt(ratio[0]*ratio[1]))
         for item in self.items:
-            value = self.widget.master._texts[item]
-            value[0] *= math.sqrt(ratio[0]*ratio[1])
-            value[1].config(size=round(value[0]))
-            self.widget.master.itemconfigure(item, font=value[1])
             self.widget.master.scale(item, 0, 0, *ratio)
 
+    def _refit(self) -> None:
+        """Internal Method: Adapt the displayed part of the value to the zoomed size and font"""
+
+    def destroy(self) -> None:
+        """Destroy the `Text`, and give up its font"""
+        for item in self.items:
+            self.widget.master._texts.pop(item, None)
+        Component.destroy(self)
+        self.widget.master._release_font(*self._font_key)
+
 
 class Image(Component):
     """Base Class: an image of a `Widget`"""
@@ -987,8 +1653,16 @@ class Widget:
 
         self.state: str = state
         self._before_disabled: str = ""
+        self._order: int = next(master._counter)
+        self._realized: bool = not master._lazy
+        self._pending: list[Component] = []
 
         master._widgets.append(self)
+        if not self._realized:
+            master._unrealized[self] = None
+            master._realize_idle()  # Added to a displayed Canvas, it may be in view already
+        self._reindex()
+        self._wake()
 
     def register(self, component: Component) -> None:
         """"""
@@ -998,19 +1672,72 @@ class Widget:
             self.texts.append(component)
         elif isinstance(component, Image):
             self.images.append(component)
+        if not self._realized:  # Displayed when the widget is realized
+            self._pending.append(component)
+            return self._reindex()
         component.display()
         component.update(no_delay=True)
+        if self in self.master._culled:
+            for item in component.items:
+                self.master.itemconfigure(item, state="hidden")
+        self._reindex()
+
+    def realize(self) -> None:
+        """Create the items of the widget on its master, if it is lazy and has not been realized yet"""
+        if self._realized:
+            return
+        self._realized = True
+        self.master._unrealized.pop(self, None)
+        pending, self._pending = self._pending, []
+        with self.master.batch():
+            for component in pending:
+                component.display()
+                if component.visible:
+                    component.update(no_delay=True)
+                else:
+                    component.disappear()
+                if self in self.master._culled:
+                    for item in component.items:
+                        self.master._itemconfigure_batched(item, state="hidden")
+        self._reindex()
+
+    def region(self) -> tuple[int, int, int, int]:
+        """Return the decision region of the widget, which covers all of its components"""
+        x1, y1, x2, y2 = self.x, self.y, self.x + self.w, self.y + self.h
+        for elem in self.shapes + self.texts + self.images:
+            left, top, right, bottom = elem.region()
+            x1, y1 = min(x1, left), min(y1, top)
+            x2, y2 = max(x2, right), max(y2, bottom)
+        return x1, y1, x2, y2
+
+    def _unculled_zoom(self) -> None:
+        """Internal Method: Apply the zoom that is pending while the widget is out of view"""
+        if (culled := self.master._culled.get(self)) is not None and culled[:2] != [1, 1]:
+            self.master._zoom_widget(self, culled[:2])
+            culled[:2] = 1., 1.
+
+    def _reindex(self) -> None:
+        """Internal Method: Refresh the position of the widget in the spatial index of its master"""
+        self._unculled_zoom()
+        self.master._index.insert(self, region := self.region())
+        if self.master._scrollable:
+            self.master._cull(self, region)
+
+    def _wake(self) -> None:
+        """Internal Method: Keep track of whether the widget is at rest or not"""
+        if self.state.startswith("normal") or self.state == "disabled":
+            self.master._awake.discard(self)
+        else:
+            self.master._awake.add(self)
 
     def _zoom(self, ratio: tuple[float, float] | None = None) -> None:
         """Zoom self"""
         if ratio is None:
             ratio = self.master._ratio
-        self.w *= ratio[0]
-        self.h *= ratio[1]
-        self.x *= ratio[0]
-        self.y *= ratio[1]
         for elem in self.shapes + self.texts + self.images:
             elem.zoom(ratio)
+        self.master._zoom_widget(self, ratio)  # After the fonts, for refitting the texts
+        self._reindex()
 
     def update(self, state: str | None = None, *, no_delay: bool = False) -> None:
         """Update the widget"""
@@ -1018,15 +1745,19 @@ class Widget:
             return
         if state is not None:
             self.state = state
-        for elem in self.shapes + self.texts:
-            elem.update(state, no_delay=no_delay)
+            self._wake()
+        with self.master.batch():
+            for elem in self.shapes + self.texts:
+                elem.update(state, no_delay=no_delay)
 
     def move(self, dx: int, dy: int) -> None:
         """Move the widget"""
+        self._unculled_zoom()  # Otherwise the pending zoom would scale the movement too
         self.x += dx
         self.y += dy
         for elem in self.shapes + self.texts + self.images:
             elem.move(dx, dy)
+        self._reindex()
 
     def moveto(self, x: int, y: int) -> None:
         """Move the Widget to a certain position"""
@@ -1049,6 +1780,12 @@ class Widget:
     def destroy(self) -> None:
         """Destroy the widget"""
         self.master._widgets.remove(self)
+        self.master._index.remove(self)
+        self.master._awake.discard(self)
+        self.master._hovered.discard(self)
+        self.master._culled.pop(self, None)
+        self.master._stale.discard(self)
+        self.master._unrealized.pop(self, None)
         for elem in self.shapes + self.texts + self.images:
             elem.destroy()
 
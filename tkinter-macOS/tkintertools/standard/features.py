@@ -10,20 +10,26 @@ from ..animation import animations
 class Label(core.Feature):
     """"""
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.shapes[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="arrow")
-            if self.widget.state != "hover":
-                self.widget.update("hover")
-        else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-        return flag
+    hover = True
+
+    def _detect(self, event: tkinter.Event) -> bool:
+        return self.widget.shapes[0].detect(event.x, event.y)
+
+    def _enter(self, _: tkinter.Event) -> None:
+        if self.widget.state != "hover":
+            self.widget.update("hover")
+
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
 
 
 class Button(core.Feature):
     """"""
 
+    hover = True
+    cursor = "hand2"
+
     def __init__(
         self,
         widget: core.Widget,
@@ -36,24 +42,16 @@ class Button(core.Feature):
         self._command: typing.Callable = command
         self._args: tuple = args
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.shapes[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="hand2")
-            if self.widget.state == "normal":
-                self.widget.update("hover")
-        else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-        return flag
-
-    def _move_left(self, event: tkinter.Event) -> bool:
-        return self._move_none(event)
+    def _detect(self, event: tkinter.Event) -> bool:
+        return self.widget.shapes[0].detect(event.x, event.y)
 
-    def _move_center(self, event: tkinter.Event) -> bool:
-        return self._move_none(event)
+    def _enter(self, _: tkinter.Event) -> None:
+        if self.widget.state == "normal":
+            self.widget.update("hover")
 
-    def _move_right(self, event: tkinter.Event) -> bool:
-        return self._move_none(event)
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
 
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state == "hover":
@@ -73,17 +71,18 @@ class Button(core.Feature):
 class UnderLine(Button):
     """"""
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.texts[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="hand2")
-            if self.widget.state == "normal":
-                self.widget.update("hover")
-                self.widget.texts[0].font.config(underline=True)
-        else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-                self.widget.texts[0].font.config(underline=False)
-        return flag
+    def _detect(self, event: tkinter.Event) -> bool:
+        return self.widget.texts[0].detect(event.x, event.y)
+
+    def _enter(self, _: tkinter.Event) -> None:
+        if self.widget.state == "normal":
+            self.widget.update("hover")
+            self.widget.texts[0].set_font(underline=True)
+
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+            self.widget.texts[0].set_font(underline=False)
 
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state == "hover":
@@ -95,7 +94,7 @@ class UnderLine(Button):
         if flag := self.widget.texts[0].detect(event.x, event.y):
             if self.widget.state == "active":
                 self.widget.update("hover")
-                self.widget.texts[0].font.config(underline=True)
+                self.widget.texts[0].set_font(underline=True)
                 if self._command is not None:
                     self._command(*self._args)
         return flag
@@ -104,19 +103,20 @@ class UnderLine(Button):
 class Highlight(Button):
     """"""
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.texts[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="hand2")
-            if self.widget.state == "normal":
-                self.widget.update("hover")
-                animations.ScaleFontSize(
-                    self.widget.texts[0], 150, delta=28).start()
-        else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-                animations.ScaleFontSize(
-                    self.widget.texts[0], 150, delta=24).start()
-        return flag
+    def _detect(self, event: tkinter.Event) -> bool:
+        return self.widget.texts[0].detect(event.x, event.y)
+
+    def _enter(self, _: tkinter.Event) -> None:
+        if self.widget.state == "normal":
+            self.widget.update("hover")
+            animations.ScaleFontSize(
+                self.widget.texts[0], 150, delta=28).start()
+
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+            animations.ScaleFontSize(
+                self.widget.texts[0], 150, delta=24).start()
 
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state == "hover":
@@ -140,17 +140,15 @@ class Highlight(Button):
 class Switch(Button):
     """"""
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.shapes[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="hand2")
-            if self.widget.state.startswith("normal"):
-                self.widget.update(
-                    f"hover-{'on' if self.widget.get() else 'off'}")
-        else:
-            if not self.widget.state.startswith("normal"):
-                self.widget.update(
-                    f"normal-{'on' if self.widget.get() else 'off'}")
-        return flag
+    def _enter(self, _: tkinter.Event) -> None:
+        if self.widget.state.startswith("normal"):
+            self.widget.update(
+                f"hover-{'on' if self.widget.get() else 'off'}")
+
+    def _leave(self, _: tkinter.Event) -> None:
+        if not self.widget.state.startswith("normal"):
+            self.widget.update(
+                f"normal-{'on' if self.widget.get() else 'off'}")
 
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state.startswith("hover"):
@@ -201,15 +199,11 @@ class ProgressBar(Label):
 class Entry(Button):
     """"""
 
-    def _move_none(self, event: tkinter.Event) -> bool:
-        if flag := self.widget.shapes[0].detect(event.x, event.y):
-            self.widget.master.trigger_config.update(cursor="xterm")
-            if self.widget.state == "normal":
-                self.widget.update("hover")
-        else:
-            if self.widget.state == "hover":
-                self.widget.update("normal")
-        return flag
+    cursor = "xterm"
+
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state == "hover":
+            self.widget.update("normal")
 
     def _click_left(self, event: tkinter.Event) -> bool:
         if flag := self.widget.shapes[0].detect(event.x, event.y):
@@ -233,11 +227,72 @@ class Entry(Button):
             match event.keysym:
                 case "Right": self.widget.texts[0].move_area(1)
                 case "Left": self.widget.texts[0].move_area(-1)
-                case "BackSpace":
-                    if self.widget.texts[0].value:
-                        self.widget.texts[0].pop(1)
+                case "BackSpace": self.widget.texts[0].pop(1)
                 case _:
                     if event.char.isprintable():
                         if not self.widget.texts[0].limitation():
                             self.widget.texts[0].append(event.char)
         return False
+
+
+class TextBox(Entry):
+    """"""
+
+    def _click_left(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.update("active")
+            if self.widget.state == "active":  # Maybe widget is disabled
+                text = self.widget.texts[0]
+                text.cursor_set(*text.locate(event.x, event.y))
+                self.widget.master.trigger_focus.update(
+                    True, text.items[text.row-text.top])
+        else:
+            if self.widget.state != "normal":
+                self.widget.update("normal")
+        return flag
+
+    def _wheel(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.texts[0].scroll(-3 if event.delta > 0 else 3)
+        return flag
+
+    def _input(self, event: tkinter.Event) -> bool:
+        if self.widget.state == "active":
+            match event.keysym:
+                case "Right": self.widget.texts[0].move_cursor(0, 1)
+                case "Left": self.widget.texts[0].move_cursor(0, -1)
+                case "Down": self.widget.texts[0].move_cursor(1, 0)
+                case "Up": self.widget.texts[0].move_cursor(-1, 0)
+                case "BackSpace": self.widget.texts[0].pop(1)
+                case "Return": self.widget.texts[0].append("\n")
+                case _:
+                    if event.char.isprintable():
+                        self.widget.texts[0].append(event.char)
+        return False
+
+
+class ListBox(Label):
+    """"""
+
+    def __init__(
+        self,
+        widget: core.Widget,
+        *,
+        command: typing.Callable[[int], typing.Any] | None = None,
+    ) -> None:
+        """"""
+        core.Feature.__init__(self, widget)
+        self._command = command
+
+    def _click_left(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            if (index := self.widget.texts[0].locate(event.y)) is not None:
+                self.widget.select(index)
+                if self._command is not None:
+                    self._command(index)
+        return flag
+
+    def _wheel(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.scroll(-3 if event.delta > 0 else 3)
+        return flag
@@ -1,11 +1,62 @@
 """All standard Shapes"""
 
+import functools
+import itertools
 import math
+import typing
 import warnings
 
 from .. import core
 
 
+@functools.lru_cache(1024)
+def _rounded_vertices(w: float, h: float, r: float) -> tuple[float, ...]:
+    """
+    Internal Function: Return the vertices of a rounded rectangle at the origin for a smoothed polygon
+
+    Each corner is a spline controlled by the corner point, and each side is kept straight
+    by doubling its end points
+    """
+    return (r, 0, r, 0, w-r, 0, w-r, 0, w, 0, w, r, w, r, w, h-r, w, h-r, w, h,
+            w-r, h, w-r, h, r, h, r, h, 0, h, 0, h-r, 0, h-r, 0, r, 0, r, 0, 0)
+
+
+def _translate(vertices: tuple[float, ...], x: float, y: float) -> list[float]:
+    """Internal Function: Move the vertices by (x, y)"""
+    return [value + offset for value, offset in zip(vertices, itertools.cycle((x, y)))]
+
+
+def _affine(template: tuple[tuple[float, float, float, float], ...], x: float, y: float, w: float, h: float) -> list[float]:
+    """
+    Internal Function: Map a template of vertices into the box (x, y, w, h)
+
+    Each vertex of the template is (ax, bx, ay, by), which is mapped to (x + ax*w + bx*h, y + ay*w + by*h)
+    """
+    return [value for ax, bx, ay, by in template for value in (x + ax*w + bx*h, y + ay*w + by*h)]
+
+
+@functools.lru_cache(256)
+def _regular_polygon_template(side: int, angle: float) -> tuple[tuple[float, float, float, float], ...]:
+    """Internal Function: Return the template of a regular polygon inscribed in a square"""
+    return tuple(((1 + math.cos(math.tau*i/side + angle))/2, 0,
+                  0, (1 + math.sin(math.tau*i/side + angle))/2) for i in range(side))
+
+
+@functools.lru_cache(256)
+def _sharp_rectangle_template(theta: float, ratio: tuple[float, float]) -> tuple[tuple[float, float, float, float], ...]:
+    """Internal Function: Return the template of a sharp rectangle"""
+    tan = math.tan(theta)
+    return ((0, 0, 0, ratio[0]), (0, tan*ratio[0], 0, 0), (1, -tan*ratio[1], 0, 0),
+            (1, 0, 0, 1 - ratio[1]), (1, -tan*ratio[1], 0, 1), (0, tan*ratio[0], 0, 1))
+
+
+@functools.lru_cache(256)
+def _parallelogram_template(theta: float) -> tuple[tuple[float, float, float, float], ...]:
+    """Internal Function: Return the template of a parallelogram"""
+    tan = math.tan(theta)
+    return ((0, tan, 0, 0), (1, 0, 0, 0), (1, -tan, 0, 1), (0, 0, 0, 1))
+
+
 class Line(core.Shape):
     """"""
 
@@ -68,22 +119,30 @@ class RegularPolygon(core.Shape):
         core.Shape.__init__(self, widget, rel_position, size,
                             name=name, styles=styles, animation=animation)
 
+    def _points(self) -> list[float]:
+        """Internal Method: Return the vertices"""
+        d = min(self.w, self.h)
+        return _affine(_regular_polygon_template(self.side, self.angle),
+                       self.x + (self.w-d)/2, self.y + (self.h-d)/2, d, d)
+
     def display(self) -> None:
-        r = min(self.w, self.h) / 2
         if self.side < 3:
             warnings.warn("Parameters are not suitable")
-        points = []
-        for i in range(self.side):
-            angle = math.tau*i/self.side+self.angle
-            points.append(math.cos(angle)*r + self.x + self.w/2)
-            points.append(math.sin(angle)*r + self.y + self.h/2)
 
         self.items = [self.widget.master.create_polygon(
-            *points, tags=("fill", "fill", "outline", "outline"))]
+            *self._points(), tags=("fill", "fill", "outline", "outline"))]
 
 
 class RoundedRectangle(core.Shape):
-    """"""
+    """
+    Rectangle with rounded corners
+
+    It is drawn with 14 items of arcs, rectangles and lines in `arc` mode, or with a single
+    smoothed polygon in `polygon` mode. The mode of all instances can be changed by setting
+    the class attribute `mode`
+    """
+
+    mode: typing.Literal["arc", "polygon"] = "arc"
 
     def __init__(
         self,
@@ -95,11 +154,22 @@ class RoundedRectangle(core.Shape):
         animation: bool = True,
         styles: dict[str, dict[str, str]] | None = None,
         radius: int = 5,
+        mode: typing.Literal["arc", "polygon"] | None = None,
     ) -> None:
+        """
+        * `radius`: the radius of the corners
+        * `mode`: how it is drawn, default value follows the class attribute `mode`
+        """
         self.radius = radius
+        if mode is not None:
+            self.mode = mode
         core.Shape.__init__(self, widget, rel_position, size,
                             name=name, styles=styles, animation=animation)
 
+    def _points(self) -> list[float]:
+        """Internal Method: Return the vertices of the smoothed polygon"""
+        return _translate(_rounded_vertices(self.w, self.h, self.radius), self.x, self.y)
+
     def display(self) -> None:
         """"""
         x, y, w, h = self.x, self.y, self.w, self.h
@@ -115,6 +185,11 @@ class RoundedRectangle(core.Shape):
             warnings.warn("Parameters are not suitable")
             warnings.warn("Parameters are not suitable")
 
+        if self.mode == "polygon":
+            self.items = [self.widget.master.create_polygon(
+                *self._points(), smooth=True, tags=("fill", "fill", "outline", "outline"))]
+            return
+
         self.items = [
             self.widget.master.create_arc(
                 x1, y1, x1+d, y1+d, outline="", start=90, tags=("fill", "fill")),
@@ -148,7 +223,43 @@ class RoundedRectangle(core.Shape):
 
 
 class SemicircularRectangle(core.Shape):
-    """"""
+    """
+    Rectangle with semicircular ends
+
+    It is drawn with 7 items of arcs, rectangles and lines in `arc` mode, or with a single
+    smoothed polygon in `polygon` mode. The mode of all instances can be changed by setting
+    the class attribute `mode`
+    """
+
+    mode: typing.Literal["arc", "polygon"] = "arc"
+
+    def __init__(
+        self,
+        widget: core.Widget,
+        rel_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        mode: typing.Literal["arc", "polygon"] | None = None,
+    ) -> None:
+        """
+        * `mode`: how it is drawn, default value follows the class attribute `mode`
+        """
+        if mode is not None:
+            self.mode = mode
+        core.Shape.__init__(self, widget, rel_position, size,
+                            name=name, styles=styles, animation=animation)
+
+    def _points(self, w: float | None = None) -> list[float]:
+        """
+        Internal Method: Return the vertices of the smoothed polygon
+
+        * `w`: the width of the shape, default value is its own width
+        """
+        w = self.w if w is None else w
+        return _translate(_rounded_vertices(w, self.h, self.h/2), self.x, self.y)
 
     def display(self) -> None:
         """"""
@@ -162,6 +273,11 @@ class SemicircularRectangle(core.Shape):
         elif d == 0:
             warnings.warn("Parameters are not suitable")
 
+        if self.mode == "polygon":
+            self.items = [self.widget.master.create_polygon(
+                *self._points(), smooth=True, tags=("fill", "fill", "outline", "outline"))]
+            return
+
         self.items = [
             self.widget.master.create_arc(
                 x1, y1, x1+d, y1+d, outline="", extent=180, start=90, tags=("fill", "fill")),
@@ -204,32 +320,21 @@ class SharpRectangle(core.Shape):
         core.Shape.__init__(self, widget, rel_position, size,
                             name=name, styles=styles, animation=animation)
 
+    def _points(self) -> list[float]:
+        """Internal Method: Return the vertices"""
+        return _affine(_sharp_rectangle_template(self.theta, tuple(self.ratio)),
+                       self.x, self.y, self.w, self.h)
+
     def display(self) -> None:
         """"""
-        x, y, w, h = self.x, self.y, self.w, self.h
-
-        if w < h:
+        if self.w < self.h:
             warnings.warn("Parameters are not suitable")
 
-        dy = [h*value for value in self.ratio]
-        dx = [math.tan(self.theta)*y for y in dy]
-
-        if sum(dx) > w:
+        if math.tan(self.theta)*self.h*sum(self.ratio) > self.w:
             warnings.warn("Parameters are not suitable")
 
-        x1, y1, x2, y2 = x, y, x + w, y + h
-
-        points = [
-            x1, y1+dy[0],
-            x1+dx[0], y1,
-            x2-dx[1], y1,
-            x2, y2-dy[1],
-            x2-dx[1], y2,
-            x1+dx[0], y2
-        ]
-
         self.items = [self.widget.master.create_polygon(
-            *points, tags=("fill", "fill", "outline", "outline"))]
+            *self._points(), tags=("fill", "fill", "outline", "outline"))]
 
 
 class Parallelogram(core.Shape):
@@ -252,21 +357,14 @@ class Parallelogram(core.Shape):
         core.Shape.__init__(self, widget, rel_position, size,
                             name=name, styles=styles, animation=animation)
 
+    def _points(self) -> list[float]:
+        """Internal Method: Return the vertices"""
+        return _affine(_parallelogram_template(self.theta), self.x, self.y, self.w, self.h)
+
     def display(self) -> None:
         """"""
-        x, y, w, h = self.x, self.y, self.w, self.h
-
-        if (dx := h*math.tan(self.theta)) >= w:
+        if self.h*math.tan(self.theta) >= self.w:
             warnings.warn("Parameters are not suitable")
 
-        x1, y1, x2, y2 = x, y, x + w, y + h
-
-        points = [
-            x1+dx, y1,
-            x2, y1,
-            x2-dx, y2,
-            x1, y2
-        ]
-
         self.items = [self.widget.master.create_polygon(
-            *points, tags=("fill", "fill", "outline", "outline"))]
+            *self._points(), tags=("fill", "fill", "outline", "outline"))]
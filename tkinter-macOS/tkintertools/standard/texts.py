@@ -1,8 +1,10 @@
 """All standard Texts"""
 
+import math
 import typing
 
 from .. import core
+from ..animation import animations
 
 
 class Information(core.Text):
@@ -21,38 +23,197 @@ class Information(core.Text):
         if len(text) > self.limit:
             text = text[:self.limit]
         self.value = text
-        self.widget.master.itemconfigure(self.items[0], text=self.value)
+        if self.items:  # The widget may not be realized yet
+            self.widget.master.itemconfigure(self.items[0], text=self.value)
+        self.widget._reindex()
 
     def append(self, text: str) -> None:
         """Append value to the value of `Text`"""
         if len(self.value) + len(text) > self.limit:
             text = self.value[:self.limit-len(self.value)]
         self.value = self.value + text
-        self.widget.master.itemconfigure(self.items[0], text=self.value)
+        if self.items:  # The widget may not be realized yet
+            self.widget.master.itemconfigure(self.items[0], text=self.value)
+        self.widget._reindex()
 
     def delete(self, num: int) -> None:
         """Remove a portion of the `Text` value from the trail"""
         if num > len(self.value):
             num = len(self.value)
         self.value = self.value[:-num]
-        self.widget.master.itemconfigure(self.items[0], text=self.value)
+        if self.items:  # The widget may not be realized yet
+            self.widget.master.itemconfigure(self.items[0], text=self.value)
+        self.widget._reindex()
 
     def clear(self) -> None:
         """Clear the value of `Text`"""
         self.value = ""
-        self.widget.master.itemconfigure(self.items[0], text=self.value)
+        if self.items:  # The widget may not be realized yet
+            self.widget.master.itemconfigure(self.items[0], text=self.value)
+        self.widget._reindex()
+
+
+class _GapBuffer:
+    """
+    Internal Class: A sequence of characters with a gap at the last edited position
+
+    Inserting or deleting characters near the last edit only moves the gap a little
+    """
+
+    def __init__(self, text: str = "", capacity: int = 16) -> None:
+        """
+        * `text`: initial characters
+        * `capacity`: initial size of the gap
+        """
+        self._buffer: list[str] = list(text) + [""]*capacity
+        self._start = len(text)
+        self._end = len(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffer) - self._end + self._start
+
+    def __str__(self) -> str:
+        return "".join(self._buffer[:self._start]) + "".join(self._buffer[self._end:])
+
+    def __getitem__(self, index: int) -> str:
+        """Return the character at the index"""
+        return self._buffer[index if index < self._start else index - self._start + self._end]
+
+    def slice(self, start: int, end: int) -> str:
+        """Return the characters in [start, end)"""
+        if end <= self._start:
+            return "".join(self._buffer[start:end])
+        if start >= self._start:
+            offset = self._end - self._start
+            return "".join(self._buffer[start+offset:end+offset])
+        return "".join(self._buffer[start:self._start]) + \
+            "".join(self._buffer[self._end:end-self._start+self._end])
+
+    def _move(self, index: int) -> None:
+        """Internal Method: Move the gap to the index"""
+        if index < self._start:
+            count = self._start - index
+            self._buffer[self._end-count:self._end] = self._buffer[index:self._start]
+            self._start, self._end = index, self._end - count
+        elif index > self._start:
+            count = index - self._start
+            self._buffer[self._start:index] = self._buffer[self._end:self._end+count]
+            self._start, self._end = index, self._end + count
+
+    def insert(self, index: int, text: str) -> None:
+        """Insert characters at the index"""
+        self._move(index)
+        if (extra := len(text) - (self._end - self._start)) > 0:
+            extra += len(self._buffer)  # Grow the gap geometrically
+            self._buffer[self._end:self._end] = [""]*extra
+            self._end += extra
+        self._buffer[self._start:self._start+len(text)] = text
+        self._start += len(text)
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete the characters in [start, end)"""
+        self._move(start)
+        self._end += end - start
 
 
 class SingleLineText(core.Text):
-    """"""
+    """
+    Text of a single line, of which only a window around the cursor is displayed
+
+    The value is stored in a gap buffer, and the window is computed from cached widths of characters,
+    so each edit updates the item on the `Canvas` once
+    """
+
+    @property
+    def value(self) -> str:
+        """The whole value of `Text`"""
+        if self._value is None:
+            self._value = str(self._buffer)
+        return self._value
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._buffer = _GapBuffer(value)
+        self._value: str | None = value
+        self._cursor = len(value)
 
     def display(self) -> None:
         self.items.append(self.widget.master.create_text(
-            *self.center(), text=self.value, font=self.font, tags=("fill", "fill")))
+            *self.center(), text="", font=self.font, tags=("fill", "fill")))
+        self._fit()
+        self._refresh()
+
+    def region(self) -> tuple[int, int, int, int]:
+        """Return the decision region of the displayed part of `Text`"""
+        metrics = self.widget.master._get_metrics(self.font)
+        width_half = metrics.width(self._text_get())/2
+        height_half = -metrics.size / 2
+        x, y = self.center()
+        return x-width_half, y-height_half, x+width_half, y+height_half
+
+    def _forward(self, left: int) -> tuple[int, int]:
+        """Internal Method: Return the end and the width of the widest window that starts at `left`"""
+        metrics = self.widget.master._get_metrics(self.font)
+        right, width, length = left, 0, len(self._buffer)
+        while right < length and width + (char := metrics.char(self._buffer[right])) < self.w - 2:
+            right, width = right + 1, width + char
+        return right, width
+
+    def _backward(self, right: int, width: int = 0) -> int:
+        """Internal Method: Return the start of the widest window that ends at `right`"""
+        metrics = self.widget.master._get_metrics(self.font)
+        left = right
+        while left > 0 and width + (char := metrics.char(self._buffer[left-1])) < self.w - 2:
+            left, width = left - 1, width + char
+        return left
+
+    def _fit(self) -> None:
+        """Internal Method: Compute the displayed window so that it contains the cursor"""
+        self.left = min(self.left, self._cursor, len(self._buffer))
+        self.right, width = self._forward(self.left)
+        if self._cursor > self.right:
+            self.right = self._cursor
+            self.left = self._backward(self.right)
+        elif self.right == len(self._buffer):  # Fill the free space on the left
+            self.left = self._backward(self.left, width)
+
+    def _refit(self) -> None:
+        """Internal Method: Compute the displayed window again for the zoomed size and font"""
+        if self.items:  # The widget may not be realized yet
+            self._fit()
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Internal Method: Display the window and the cursor with one update of the item"""
+        if not self.items:  # The widget may not be realized yet
+            return
+        with self.widget.master.batch():
+            self.widget.master._itemconfigure_batched(
+                self.items[0], text=self._text_get())
+            self.widget.master._batch_call(
+                "icursor", self.items[0], self._cursor - self.left)
+
+    def _edit(self, start: int, end: int, value: str = "") -> None:
+        """Internal Method: Replace the characters in [start, end) of the value with `value`"""
+        if end > start:
+            self._buffer.delete(start, end)
+            if self._cursor > end:
+                self._cursor -= end - start
+            elif self._cursor > start:
+                self._cursor = start
+        if len(self._buffer) + len(value) > self.limit:
+            value = value[:max(0, self.limit - len(self._buffer))]
+        if value:
+            self._buffer.insert(start, value)
+            if self._cursor >= start:
+                self._cursor += len(value)
+        self._value = None
+        self._fit()
+        self._refresh()
 
     def _text_get(self) -> str:
         """"""
-        return self.widget.master.itemcget(self.items[0], "text")
+        return self._buffer.slice(self.left, self.right)
 
     def _text_set(self, value: str) -> None:
         """"""
@@ -72,36 +233,20 @@ class SingleLineText(core.Text):
 
     def set(self, value: str) -> None:
         """"""
-        self.value = value
-        self._text_set(value)
+        self.value = value if len(value) <= self.limit else value[:self.limit]
+        self.left = 0
+        self._fit()
+        self._refresh()
 
     def insert(self, index: int, value: str) -> None:
         """"""
         if index < 0:
             index = self._text_length() + index
-        key_index = self.left+index
-        self.value = self.value[:key_index] + value + self.value[key_index:]
-        self._text_insert(index, value)
-
-        while self._text_overflow():
-            length = self._text_length()
-            if self.cursor_get() == length:
-                self._text_delete(0, 0)
-            else:
-                self._text_delete(length-1, "end")
+        self._edit(self.left+index, self.left+index, value)
 
     def delete(self, start: int, end: int | typing.Literal["end"]) -> None:
         """[start, end]"""
-        if end == "end":
-            self.value = self.value[:self.left+start]
-        else:
-            self.value = self.value[:self.left+start] + \
-                self.value[self.left+end+1:]
-        self._text_delete(start, end)
-
-        while self.overflow():
-            if self.cursor_get() == 0:
-                break
+        self._edit(self.left+start, len(self._buffer) if end == "end" else self.left+end+1)
 
     def select_set(self, start: int, end: int) -> None:
         """[start, end]"""
@@ -124,7 +269,7 @@ class SingleLineText(core.Text):
 
     def _text_length(self) -> int:
         """"""
-        return self.widget.master.index(self.items[0], "end")
+        return self.right - self.left
 
     def bbox(self) -> tuple[int, int, int, int]:
         """"""
@@ -139,63 +284,455 @@ class SingleLineText(core.Text):
         """"""
         if index < 0:
             index = self._text_length() + index + 1
-        self.widget.master.icursor(self.items[0], index)
+        self._cursor = max(0, min(self.left + index, len(self._buffer)))
+        self._fit()
+        self._refresh()
 
     def cursor_get(self) -> int:
         """"""
-        return self.widget.master.index(self.items[0], "insert")
+        return self._cursor - self.left
 
     def limitation(self) -> int:
         """"""
-        if (count := len(self.value) - self.limit) > 0:
+        if (count := len(self._buffer) - self.limit) > 0:
             return count
         return 0
 
     def get_face_text(self, add: bool) -> str:
         """"""
-        if add:
-            for i in range(-2, 3):
-                if self.font.measure(self.value[self.left: self.right+i]) >= self.w:
-                    self.right += i
-                    break
-        else:
-            for i in range(-2, 3):
-                if self.font.measure(self.value[self.left-i: self.right+i]) >= self.w:
-                    self.left += i
-                    break
-        return self.value[self.left: self.right]
+        self._fit()
+        return self._text_get()
 
     def _text_overflow(self) -> bool:
         """"""
-        return self.font.measure(self._text_get()) >= self.w - 2
+        return self.widget.master._get_metrics(self.font).width(self._text_get()) >= self.w - 2
 
     def overflow(self) -> bool:
         """"""
-        return self.font.measure(self.value) >= self.w - 2
+        return self.widget.master._get_metrics(self.font).width(self.value) >= self.w - 2
 
     def update_add(self, anchor_left: bool) -> None:
         """"""
         if anchor_left:
-            while self._text_overflow():
-                self._text_set(self._text_get()[:-1])
+            self.right = self._forward(self.left)[0]
         else:
-            while self._text_overflow():
-                self._text_set(self._text_get()[1:])
+            self.left = self._backward(self.right)
+        self._cursor = max(self.left, min(self._cursor, self.right))
+        self._refresh()
 
     def move_area(self, count: int) -> None:
         """"""
-        index = self.cursor_get()
-        if count < 0 < index:
-            return self.cursor_set(index + count)
-        if 0 < count and index < self._text_length():
-            return self.cursor_set(index + count)
+        self._cursor = max(0, min(self._cursor + count, len(self._buffer)))
+        self._fit()
+        self._refresh()
 
     def pop(self, count: int) -> None:
         """"""
-        if (index := self.cursor_get() - 1) >= 0:
-            self.delete(index, index)
+        if self._cursor:  # Nothing to delete before the cursor otherwise
+            self._edit(max(0, self._cursor - count), self._cursor)
 
     def append(self, value: str) -> None:
         """"""
-        if self._text_length() < self.limit:
-            self.insert(self.cursor_get(), value)
+        self._edit(self._cursor, self._cursor, value)
+
+
+class MultiLineText(core.Text):
+    """
+    Text of multiple lines, of which only the lines in view are displayed
+
+    Each line in view is displayed by an item of a pool, and the items are reused when scrolling,
+    so the cost of displaying depends on the size of the view instead of the number of lines.
+    Lines wider than the view are scrolled horizontally to follow the cursor
+    """
+
+    padding: int = 5
+
+    @property
+    def value(self) -> str:
+        """The whole value of `Text`"""
+        return "\n".join(self.lines)
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self.lines: list[str] = value.split("\n")
+        self.row = len(self.lines) - 1
+        self.col = len(self.lines[-1])
+        self.top = 0
+        self.left = 0
+
+    def display(self) -> None:
+        self._shown: list[str] = []
+        self._resize_pool()
+        self._fit()
+        self._refresh()
+
+    def region(self) -> tuple[int, int, int, int]:
+        """Return the decision region of the `Text`"""
+        return self.x, self.y, self.x + self.w, self.y + self.h
+
+    def _view(self) -> int:
+        """Internal Method: Return the number of lines in view"""
+        linespace = self.widget.master._get_metrics(self.font).linespace
+        return max(1, int((self.h - 2*self.padding) // linespace))
+
+    def _resize_pool(self) -> None:
+        """Internal Method: Make the pool of items as large as the view"""
+        if (count := self._view()) == len(self.items):
+            return
+        linespace = self.widget.master._get_metrics(self.font).linespace
+        while len(self.items) > count:
+            item = self.items.pop()
+            self._shown.pop()
+            self.widget.master.delete(item)
+            animations._stop_gradients(self.widget.master, item)
+            self.widget.master._item_options.pop(item, None)
+            self.widget.master._texts.pop(item, None)
+        while len(self.items) < count:
+            self.items.append(self.widget.master.create_text(
+                self.x + self.padding, self.y + self.padding + len(self.items)*linespace,
+                anchor="nw", text="", font=self.font, tags=("fill", "fill")))
+            self._shown.append("")
+        self.update(no_delay=True)
+
+    def _refit(self) -> None:
+        """Internal Method: Lay out the pool again for the zoomed size and font, and display the lines in view"""
+        if not self.widget._realized:
+            return
+        self._resize_pool()
+        linespace = self.widget.master._get_metrics(self.font).linespace
+        with self.widget.master.batch():
+            for index, item in enumerate(self.items):
+                self.widget.master._batch_call(
+                    "coords", item, self.x + self.padding, self.y + self.padding + index*linespace)
+        self._shown = [None]*len(self.items)  # The width of the lines in view has changed
+        self.top = max(0, min(self.top, len(self.lines) - len(self.items)))
+        self.left = 0  # Moved forward again by _fit as far as the cursor needs
+        self._fit()
+        self._refresh()
+
+    def _clip(self, line: str) -> str:
+        """Internal Method: Return the part of a line in view, which starts at the column `left`"""
+        metrics = self.widget.master._get_metrics(self.font)
+        width, limit = 0, self.w - 2*self.padding
+        for index in range(self.left, len(line)):
+            if (width := width + metrics.char(line[index])) > limit:
+                return line[self.left:index]
+        return line[self.left:]
+
+    def _fit(self) -> None:
+        """Internal Method: Scroll the view vertically and horizontally so that it contains the cursor"""
+        if self.row < self.top:
+            self.top = self.row
+        elif self.row >= self.top + len(self.items):
+            self.top = self.row - len(self.items) + 1
+        if self.col < self.left:
+            self.left = self.col
+            return
+        metrics = self.widget.master._get_metrics(self.font)
+        line, limit = self.lines[self.row], self.w - 2*self.padding
+        width = metrics.width(line[self.left:self.col])
+        while width > limit and self.left < self.col:
+            width -= metrics.char(line[self.left])
+            self.left += 1
+
+    def _refresh(self) -> None:
+        """Internal Method: Display the lines in view and the cursor with one batch"""
+        if not self.widget._realized:
+            return
+        self._resize_pool()
+        with self.widget.master.batch():
+            for index, item in enumerate(self.items):
+                row = self.top + index
+                line = self._clip(self.lines[row]) if row < len(self.lines) else ""
+                if line != self._shown[index]:
+                    self._shown[index] = line
+                    self.widget.master._itemconfigure_batched(item, text=line)
+            if self.top <= self.row < self.top + len(self.items):
+                item = self.items[self.row - self.top]
+                self.widget.master._batch_call("icursor", item, self.col - self.left)
+            else:
+                item = ""
+            if self.widget.state == "active":
+                self.widget.master._batch_call("focus", item)
+
+    def get(self) -> str:
+        """Get the value of `Text`"""
+        return self.value
+
+    def set(self, value: str) -> None:
+        """Set the value of `Text`"""
+        self.value = value
+        self._fit()
+        self._refresh()
+
+    def extend(self, lines: typing.Iterable[str]) -> None:
+        """Add lines to the end of `Text`, a value that contains line breaks is split into several lines"""
+        for line in lines:
+            self.lines.extend(line.split("\n"))
+        self._refresh()
+
+    def append(self, value: str) -> None:
+        """Insert a value at the cursor"""
+        parts = value.split("\n")
+        line = self.lines[self.row]
+        head, tail = line[:self.col], line[self.col:]
+        if len(parts) == 1:
+            self.lines[self.row] = head + value + tail
+            self.col += len(value)
+        else:
+            self.lines[self.row:self.row+1] = [
+                head + parts[0], *parts[1:-1], parts[-1] + tail]
+            self.row += len(parts) - 1
+            self.col = len(parts[-1])
+        self._fit()
+        self._refresh()
+
+    def pop(self, count: int) -> None:
+        """Delete characters before the cursor"""
+        for _ in range(count):
+            if self.col:
+                line = self.lines[self.row]
+                self.lines[self.row] = line[:self.col-1] + line[self.col:]
+                self.col -= 1
+            elif self.row:
+                self.col = len(self.lines[self.row-1])
+                self.lines[self.row-1] += self.lines.pop(self.row)
+                self.row -= 1
+            else:
+                break
+        self._fit()
+        self._refresh()
+
+    def clear(self) -> None:
+        """Clear the value of `Text`"""
+        self.set("")
+
+    def cursor_set(self, row: int, col: int) -> None:
+        """Move the cursor to the column `col` of the line `row`"""
+        self.row = max(0, min(row, len(self.lines) - 1))
+        self.col = max(0, min(col, len(self.lines[self.row])))
+        self._fit()
+        self._refresh()
+
+    def cursor_get(self) -> tuple[int, int]:
+        """Return the line and the column of the cursor"""
+        return self.row, self.col
+
+    def move_cursor(self, rows: int, cols: int) -> None:
+        """Move the cursor by lines and by columns, moving by columns wraps around lines"""
+        row, col = self.row + rows, self.col
+        if cols:
+            col += cols
+            if col < 0 < row:
+                row, col = row - 1, len(self.lines[row-1])
+            elif col > len(self.lines[row]) and row < len(self.lines) - 1:
+                row, col = row + 1, 0
+        self.cursor_set(row, col)
+
+    def locate(self, x: float, y: float) -> tuple[int, int]:
+        """Return the line and the column of the character nearest to the coordinates"""
+        metrics = self.widget.master._get_metrics(self.font)
+        row = self.top + max(0, int((y - self.y - self.padding) // metrics.linespace))
+        line = self.lines[min(row, len(self.lines) - 1)]
+        col, width, limit = self.left, 0, x - self.x - self.padding
+        for char in line[self.left:]:
+            if width + metrics.char(char)/2 > limit:
+                break
+            width += metrics.char(char)
+            col += 1
+        return row, col
+
+    def scroll(self, count: int) -> None:
+        """Scroll the view by lines"""
+        self.scroll_to(self.top + count)
+
+    def scroll_to(self, row: int) -> None:
+        """Scroll the view so that the line `row` is at the top"""
+        self.top = max(0, min(row, len(self.lines) - len(self.items)))
+        self._refresh()
+
+
+class Rows(core.Text):
+    """
+    Rows of cells, of which only the rows in view are displayed
+
+    The items of the rows in view form a pool, which is reused when scrolling,
+    so the cost of displaying depends on the size of the view instead of the number of rows
+    """
+
+    padding: int = 5
+
+    def __init__(
+        self,
+        widget: core.Widget,
+        rel_position: tuple[int, int] = (0, 0),
+        *,
+        styles: dict[str, dict[str, str]] | None = None,
+        animation: bool = True,
+        rows: typing.Iterable[typing.Sequence[str]] = (),
+        columns: int = 1,
+        header: typing.Sequence[str] | None = None,
+        widths: typing.Sequence[float] | None = None,
+        family: str | None = None,
+        size: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+    ) -> None:
+        """
+        * `rows`: the values of the cells of each row
+        * `columns`: the number of columns
+        * `header`: the titles of the columns, which are displayed above the rows
+        * `widths`: the proportions of the width of each column, default value means equal width
+        """
+        if columns < 1:
+            raise ValueError(f"At least one column is required, got {columns}")
+        if widths is not None and len(widths) != columns:
+            raise ValueError(f"{len(widths)} widths are given for {columns} columns")
+        if header is not None and len(header) != columns:
+            raise ValueError(f"{len(header)} titles are given for {columns} columns")
+        self.rows: list[typing.Sequence[str]] = list(rows)
+        self.columns = columns
+        self.header = header
+        total = sum(widths) if widths else columns
+        self.widths: list[float] = [width/total for width in widths] if widths else [1/columns]*columns
+        self.top = 0
+        self._cells: list[list[int]] = []
+        self._shown: list[list[str]] = []
+        core.Text.__init__(self, widget, rel_position, styles=styles, animation=animation,
+                           family=family, size=size, weight=weight, slant=slant)
+
+    @property
+    def rowspace(self) -> float:
+        """The height of a row"""
+        return self.widget.master._get_metrics(self.font).linespace + 2*self.padding
+
+    def display(self) -> None:
+        if self.header is not None:
+            for column, title in enumerate(self.header):
+                self.items.append(self.widget.master.create_text(
+                    self._left(column), self.y + self.rowspace/2, anchor="w",
+                    text=self._clip(title, column), font=self.font, tags=("fill", "fill")))
+        self._refresh()
+
+    def region(self) -> tuple[int, int, int, int]:
+        """Return the decision region of the `Text`"""
+        return self.x, self.y, self.x + self.w, self.y + self.h
+
+    def _left(self, column: int) -> float:
+        """Internal Method: Return the left side of the text of a column"""
+        return self.x + self.padding + sum(self.widths[:column])*self.w
+
+    def _offset(self) -> float:
+        """Internal Method: Return the distance from the top to the first row"""
+        return 0 if self.header is None else self.rowspace
+
+    def _view(self) -> int:
+        """Internal Method: Return the number of rows in view"""
+        return max(1, int((self.h - self._offset()) // self.rowspace))
+
+    def _resize_pool(self) -> None:
+        """Internal Method: Make the pool of items as large as the view"""
+        if (count := self._view()) == len(self._cells):
+            return
+        while len(self._cells) > count:
+            self._shown.pop()
+            for item in self._cells.pop():
+                self.items.remove(item)
+                self.widget.master.delete(item)
+                animations._stop_gradients(self.widget.master, item)
+                self.widget.master._item_options.pop(item, None)
+                self.widget.master._texts.pop(item, None)
+        while len(self._cells) < count:
+            y = self.y + self._offset() + (len(self._cells) + 0.5)*self.rowspace
+            self._cells.append([self.widget.master.create_text(
+                self._left(column), y, anchor="w", text="", font=self.font,
+                tags=("fill", "fill")) for column in range(self.columns)])
+            self._shown.append([""]*self.columns)
+            self.items.extend(self._cells[-1])
+        self.update(no_delay=True)
+
+    def _refit(self) -> None:
+        """Internal Method: Lay out the header and the pool again for the zoomed size and font, and display the rows in view"""
+        if not self.widget._realized:
+            return
+        self._resize_pool()
+        header = len(self.header) if self.header is not None else 0
+        with self.widget.master.batch():
+            for column, item in enumerate(self.items[:header]):
+                self.widget.master._batch_call(
+                    "coords", item, self._left(column), self.y + self.rowspace/2)
+                self.widget.master._itemconfigure_batched(
+                    item, text=self._clip(self.header[column], column))
+            for index, cells in enumerate(self._cells):
+                y = self.y + self._offset() + (index + 0.5)*self.rowspace
+                for column, item in enumerate(cells):
+                    self.widget.master._batch_call("coords", item, self._left(column), y)
+        self._shown = [[None]*self.columns for _ in self._cells]  # The width of the columns has changed
+        self.top = max(0, min(self.top, len(self.rows) - len(self._cells)))
+        self._refresh()
+        if (show_selection := getattr(self.widget, "_show_selection", None)) is not None:
+            show_selection()  # The rows of a ListBox have moved
+
+    def _clip(self, value: str, column: int) -> str:
+        """Internal Method: Return the part of a value that fits the width of a column"""
+        metrics = self.widget.master._get_metrics(self.font)
+        width, limit = 0, self.widths[column]*self.w - 2*self.padding
+        for index, char in enumerate(value):
+            if (width := width + metrics.char(char)) > limit:
+                return value[:index]
+        return value
+
+    def _refresh(self) -> None:
+        """Internal Method: Display the rows in view with one batch"""
+        if not self.widget._realized:
+            return
+        self._resize_pool()
+        with self.widget.master.batch():
+            for index, (cells, shown) in enumerate(zip(self._cells, self._shown)):
+                row = self.top + index
+                values = self.rows[row] if row < len(self.rows) else ()
+                for column, item in enumerate(cells):
+                    value = self._clip(
+                        str(values[column]), column) if column < len(values) else ""
+                    if value != shown[column]:
+                        shown[column] = value
+                        self.widget.master._itemconfigure_batched(item, text=value)
+
+    def count(self) -> int:
+        """Return the number of rows in view"""
+        return len(self._cells)
+
+    def row_top(self, index: int) -> float:
+        """Return the top of a row, which may be out of view"""
+        return self.y + self._offset() + (index - self.top)*self.rowspace
+
+    def locate(self, y: float) -> int | None:
+        """Return the index of the row at the y coordinate, or None if there is no row"""
+        index = self.top + math.floor((y - self.y - self._offset()) / self.rowspace)
+        if self.top <= index < min(self.top + len(self._cells), len(self.rows)):
+            return index
+        return None
+
+    def get(self, index: int) -> typing.Sequence[str]:
+        """Return the values of a row"""
+        return self.rows[index]
+
+    def set(self, rows: typing.Iterable[typing.Sequence[str]]) -> None:
+        """Replace all rows"""
+        self.rows = list(rows)
+        self.top = 0
+        self._refresh()
+
+    def extend(self, rows: typing.Iterable[typing.Sequence[str]]) -> None:
+        """Add rows to the end"""
+        self.rows.extend(rows)
+        self._refresh()
+
+    def scroll(self, count: int) -> None:
+        """Scroll the view by rows"""
+        self.scroll_to(self.top + count)
+
+    def scroll_to(self, index: int) -> None:
+        """Scroll the view so that the row `index` is at the top"""
+        self.top = max(0, min(index, len(self.rows) - len(self._cells)))
+        self._refresh()
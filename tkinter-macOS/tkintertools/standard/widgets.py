@@ -188,6 +188,54 @@ class Entry(core.Widget):
         self.set("")
 
 
+class TextBox(core.Widget):
+    """"""
+
+    def __init__(
+        self,
+        master: core.Canvas,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        text: str = "",
+    ) -> None:
+        core.Widget.__init__(self, master, position, size,
+                             name=name, animation=animation)
+        if constants.SYSTEM == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self, name=".out")
+            shapes.RoundedRectangle(self, name=".in", size=(self.w, self.h-3))
+        texts.MultiLineText(self, text=text)
+        features.TextBox(self)
+
+    def get(self) -> str:
+        """"""
+        return self.texts[0].get()
+
+    def set(self, value: str) -> None:
+        """"""
+        self.texts[0].set(value)
+
+    def append(self, value: str) -> None:
+        """"""
+        self.texts[0].append(value)
+
+    def extend(self, lines: typing.Iterable[str]) -> None:
+        """"""
+        self.texts[0].extend(lines)
+
+    def delete(self, count: int) -> None:
+        """"""
+        self.texts[0].pop(count)
+
+    def clear(self) -> None:
+        """"""
+        self.set("")
+
+
 class CheckButton(core.Widget):
     """"""
 
@@ -297,6 +345,17 @@ class ProgressBar(core.Widget):
     def set(self, value: float) -> None:
         """"""
         self.value = 0 if value < 0 else 1 if value > 1 else value
+        if self._realized:
+            self._draw()
+        if value == 1 and self.command is not None:
+            self.command()
+
+    def realize(self) -> None:
+        core.Widget.realize(self)
+        self._draw()
+
+    def _draw(self) -> None:
+        """Internal Method: Draw the bar according to the value"""
         if self.value == 0:
             return self.shapes[1].disappear()
         elif not self.shapes[1].visible:
@@ -305,6 +364,10 @@ class ProgressBar(core.Widget):
             x, y = self.shapes[1].x, self.shapes[1].y
             w, h = (self.w - self.h*0.2)*self.value, self.shapes[1].h
             self.master.coords(self.shapes[1].items[0], x, y, x+w, y+h)
+        elif self.shapes[1].mode == "polygon":
+            w, h = self.w - self.h*0.3 - self.shapes[1].h, self.shapes[1].h
+            self.master.coords(self.shapes[1].items[0],
+                               *self.shapes[1]._points(w*self.value + h))
         else:
             w, h = self.w - self.h*0.3 - self.shapes[1].h, self.shapes[1].h
             x, y = self.shapes[1].x + h/2, self.shapes[1].y
@@ -316,8 +379,6 @@ class ProgressBar(core.Widget):
                 self.shapes[1].items[1], x+w-h/2, y, x+w+h/2, y+h)
             self.master.coords(
                 self.shapes[1].items[4], x+w-h/2, y, x+w+h/2, y+h)
-        if value == 1 and self.command is not None:
-            self.command()
 
 
 class UnderlineButton(core.Widget):
@@ -373,3 +434,167 @@ class HighlightButton(core.Widget):
         texts.Information(self, text=text, family=family, size=fontsize, weight=weight,
                           slant=slant, underline=underline, overstrike=overstrike)
         features.Highlight(self, command=command)
+
+
+class ListBox(core.Widget):
+    """
+    List widget
+
+    Only the rows in view are displayed, so it can hold a large number of items
+    """
+
+    def __init__(
+        self,
+        master: core.Canvas,
+        position: tuple[int, int],
+        size: tuple[int, int] = (250, 300),
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        items: typing.Iterable[str] = (),
+        family: str | None = None,
+        fontsize: int | None = None,
+        command: typing.Callable[[int], typing.Any] | None = None,
+    ) -> None:
+        """
+        * `items`: the values of the items
+        * `command`: the function that is called with the index of the item clicked
+        """
+        core.Widget.__init__(self, master, position, size,
+                             name=name, animation=animation)
+        self._selected: int | None = None
+        self._shapes()
+        self._rows(items=items, family=family, fontsize=fontsize)
+        features.ListBox(self, command=command)
+        self.shapes[1].disappear()
+
+    def _shapes(self) -> None:
+        """Internal Method: Create the background and the selection"""
+        if constants.SYSTEM == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self)
+        shapes.Rectangle(self, name=".selection", size=(self.w, 0))
+
+    def _rows(self, *, items: typing.Iterable[str], family: str | None, fontsize: int | None) -> None:
+        """Internal Method: Create the rows"""
+        texts.Rows(self, rows=((item,) for item in items),
+                   family=family, size=fontsize)
+
+    def _show_selection(self) -> None:
+        """Internal Method: Move the selection to the selected row, or hide it if it is out of view"""
+        rows, selection = self.texts[0], self.shapes[1]
+        if self._selected is None or not rows.top <= self._selected < rows.top + rows.count():
+            if selection.visible:
+                selection.disappear()
+            return
+        selection.y, selection.h = rows.row_top(self._selected), rows.rowspace
+        self.master.coords(selection.items[0], selection.x, selection.y,
+                           selection.x + selection.w, selection.y + selection.h)
+        if not selection.visible:
+            selection.appear()
+
+    def realize(self) -> None:
+        core.Widget.realize(self)
+        self._show_selection()
+
+    def get(self) -> list[str]:
+        """"""
+        return [row[0] for row in self.texts[0].rows]
+
+    def set(self, items: typing.Iterable[str]) -> None:
+        """"""
+        self._selected = None
+        self.texts[0].set((item,) for item in items)
+        self._show_selection()
+
+    def append(self, item: str) -> None:
+        """"""
+        self.texts[0].extend(((item,),))
+
+    def extend(self, items: typing.Iterable[str]) -> None:
+        """"""
+        self.texts[0].extend((item,) for item in items)
+
+    def clear(self) -> None:
+        """"""
+        self.set(())
+
+    def select(self, index: int | None) -> None:
+        """Select an item, or clear the selection if `index` is None"""
+        self._selected = index
+        self._show_selection()
+
+    def selection(self) -> int | None:
+        """Return the index of the selected item"""
+        return self._selected
+
+    def scroll(self, count: int) -> None:
+        """Scroll the list by rows"""
+        self.texts[0].scroll(count)
+        self._show_selection()
+
+    def scroll_to(self, index: int) -> None:
+        """Scroll the list so that the item `index` is at the top"""
+        self.texts[0].scroll_to(index)
+        self._show_selection()
+
+
+class Table(ListBox):
+    """
+    Table widget
+
+    A list whose rows have several columns, with a header of titles
+    """
+
+    def __init__(
+        self,
+        master: core.Canvas,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        columns: typing.Sequence[str],
+        rows: typing.Iterable[typing.Sequence[str]] = (),
+        widths: typing.Sequence[float] | None = None,
+        family: str | None = None,
+        fontsize: int | None = None,
+        command: typing.Callable[[int], typing.Any] | None = None,
+    ) -> None:
+        """
+        * `columns`: the titles of the columns, at least one is required
+        * `rows`: the values of the cells of each row
+        * `widths`: the proportions of the width of each column, default value means equal width
+        * `command`: the function that is called with the index of the row clicked
+        """
+        if not columns:
+            raise ValueError("At least one column is required")
+        if widths is not None and len(widths) != len(columns):
+            raise ValueError(f"{len(widths)} widths are given for {len(columns)} columns")
+        self._columns = columns
+        self._widths = widths
+        ListBox.__init__(self, master, position, size, name=name, animation=animation,
+                         items=rows, family=family, fontsize=fontsize, command=command)
+
+    def _rows(self, *, items: typing.Iterable[typing.Sequence[str]], family: str | None, fontsize: int | None) -> None:
+        texts.Rows(self, rows=items, columns=len(self._columns), header=self._columns,
+                   widths=self._widths, family=family, size=fontsize)
+
+    def get(self) -> list[typing.Sequence[str]]:
+        """"""
+        return list(self.texts[0].rows)
+
+    def set(self, rows: typing.Iterable[typing.Sequence[str]]) -> None:
+        """"""
+        self._selected = None
+        self.texts[0].set(rows)
+        self._show_selection()
+
+    def append(self, row: typing.Sequence[str]) -> None:
+        """"""
+        self.texts[0].extend((row,))
+
+    def extend(self, rows: typing.Iterable[typing.Sequence[str]]) -> None:
+        """"""
+        self.texts[0].extend(rows)
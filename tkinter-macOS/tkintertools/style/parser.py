@@ -4,13 +4,23 @@ import functools
 import inspect
 import json
 import pathlib
+import types
+import typing
 
 from .. import core
+from ..color import rgb
 from . import theme
 
 system_theme_path = pathlib.Path(__file__).parent.parent / "theme"
 default_theme_path = pathlib.Path().cwd() / "theme"
 
+BUNDLE = "bundle.json"
+
+_INTERN_LIMIT = 1024
+
+_states: dict[frozenset, types.MappingProxyType] = {}
+_styles: dict[frozenset, types.MappingProxyType] = {}
+
 
 def _get_name(obj: "str | core.Widget | core.Component") -> str:
     """Get the name of the object"""
@@ -45,13 +55,115 @@ def _get_path(path: pathlib.Path, widget: str, component: str, dark: bool) -> pa
     return None
 
 
+def _freeze(styles: "dict[str, dict[str, str]]") -> "types.MappingProxyType[str, types.MappingProxyType[str, str]]":
+    """
+    Internal Function: Get a read-only copy of the styles
+
+    Equal styles share the same object, so they should be modified by replacing them
+
+    * `styles`: styles of each state
+    """
+    states = {}
+    for state, style in styles.items():
+        states[state] = _intern(_states, frozenset(style.items()), lambda: dict(style))
+    return _intern(_styles, frozenset((state, id(style)) for state, style in states.items()),
+                   lambda: states)
+
+
+def _intern(
+    table: dict[frozenset, types.MappingProxyType],
+    key: frozenset,
+    factory: typing.Callable[[], dict],
+) -> types.MappingProxyType:
+    """
+    Internal Function: Get the shared read-only mapping of a key from an intern table
+
+    The table keeps the `_INTERN_LIMIT` most recently used mappings, the others are dropped
+    and are only kept alive by the components still using them
+
+    * `table`: the intern table
+    * `key`: the key of the mapping
+    * `factory`: the function that returns the content of the mapping if it is not interned
+    """
+    if (frozen := table.pop(key, None)) is None:
+        frozen = types.MappingProxyType(factory())
+        if len(table) >= _INTERN_LIMIT:
+            del table[next(iter(table))]
+    table[key] = frozen  # Moved to the end as the most recently used one
+    return frozen
+
+
+@functools.lru_cache(1024)
+def _get_disabled(style: tuple[tuple[str, str], ...], bg: str) -> "types.MappingProxyType[str, str]":
+    """
+    Internal Function: Get the disabled style derived from a style and a background color
+
+    The return value of this function is cached
+
+    * `style`: items of the style referred to
+    * `bg`: background color of the `Canvas`
+    """
+    return _freeze({"disabled": {key: rgb.rgb_to_str(rgb.convert(
+        rgb.str_to_rgb(value), rgb.str_to_rgb(bg), 0.618)) for key, value in style}})["disabled"]
+
+
+def compile_theme(path: str | pathlib.Path = system_theme_path, file: str | pathlib.Path | None = None) -> pathlib.Path:
+    """
+    Pack all the style files of a theme folder into a single bundle file, and return its path
+
+    When a theme folder contains a bundle, styles are only read from the bundle,
+    so it needs to be compiled again after the style files are modified
+
+    * `path`: path to the theme folder
+    * `file`: path to the bundle file, default value is the file `bundle.json` in the theme folder
+    """
+    path = pathlib.Path(path)
+    bundle: dict[str, dict[str, dict[str, dict[str, dict[str, str]]]]] = {"dark": {}, "light": {}}
+    for folder in sorted(path.iterdir()):
+        if not folder.is_dir():
+            continue
+        for style_file in sorted(folder.glob("*.json")):
+            name = style_file.name.removesuffix(".json")
+            with open(style_file, "r", encoding="utf-8") as data:
+                styles = json.load(data)
+            for mode in ("dark", "light"):
+                if name.endswith(f".{mode}"):
+                    bundle[mode].setdefault(folder.name, {}).setdefault(
+                        name.removesuffix(f".{mode}"), styles)
+                    break
+            else:  # Style files independent of the mode take precedence
+                for mode in ("dark", "light"):
+                    bundle[mode].setdefault(folder.name, {})[name] = styles
+    file = path / BUNDLE if file is None else pathlib.Path(file)
+    with open(file, "w", encoding="utf-8") as data:
+        json.dump(bundle, data, indent=4, sort_keys=True)
+        data.write("\n")
+    return file
+
+
+@functools.cache
+def _get_bundle(path: pathlib.Path) -> "dict[str, dict[str, dict[str, dict[str, dict[str, str]]]]] | None":
+    """
+    Get the bundle of a theme folder, if it exists
+
+    The return value of this function is cached
+
+    * `path`: path to the theme folder
+    """
+    file = path / BUNDLE
+    if not file.exists():
+        return None
+    with open(file, "r", encoding="utf-8") as data:
+        return json.load(data)
+
+
 @functools.cache
-def _get_file(widget: str, component: str, path: pathlib.Path, dark: bool) -> "dict[str, dict[str, str]]":
+def _get_file(widget: str, component: str, path: pathlib.Path, dark: bool) -> "types.MappingProxyType[str, types.MappingProxyType[str, str]]":
     """
     Get the style file based on the parameters
 
     The return value of this function is cached, and when the same style file is fetched,
-    the data is fetched directly from the cache
+    the data is fetched directly from the cache. The styles are read-only and shared
 
     * `widget`: widget that need to get styles
     * `component`: component that need to get styles
@@ -59,13 +171,16 @@ def _get_file(widget: str, component: str, path: pathlib.Path, dark: bool) -> "d
     * `dark`: whether it is in dark mode
     """
     for path in set((system_theme_path, default_theme_path, path)):
-        if file := _get_path(path, widget, component, dark):
+        if (bundle := _get_bundle(path)) is not None:
+            if styles := bundle["dark" if dark else "light"].get(widget, {}).get(component):
+                return _freeze(styles)
+        elif file := _get_path(path, widget, component, dark):
             with open(file, "r", encoding="utf-8") as data:
-                return json.load(data)
-    return {}
+                return _freeze(json.load(data))
+    return _freeze({})
 
 
-def get(widget: "str | core.Widget", component: "str | core.Component", *, path: str | pathlib.Path = system_theme_path) -> "dict[str, dict[str, str]]":
+def get(widget: "str | core.Widget", component: "str | core.Component", *, path: str | pathlib.Path = system_theme_path) -> "types.MappingProxyType[str, types.MappingProxyType[str, str]]":
     """
     Get style data based on parameters
 
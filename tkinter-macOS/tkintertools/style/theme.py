@@ -17,19 +17,83 @@ _callback_events: dict[typing.Callable[[bool, typing.Any],
                                        typing.Any], tuple[typing.Any, ...]] = {}
 
 
-def use_theme(__theme: typing.Literal["system", "dark", "light"], /) -> None:
+class _Transition:
+    """
+    Internal Class: Bookkeeping of a theme switch
+
+    The work of a theme switch can be spread over several frames. Every part of the
+    work that is not finished synchronously holds the transition until it is done
+    """
+
+    def __init__(
+        self,
+        budget: float | None = None,
+        callback: typing.Callable[[], typing.Any] | None = None,
+    ) -> None:
+        """
+        * `budget`: the maximum time (ms) of work per frame, None means no limitation
+        * `callback`: the function that is called when the theme switch is completed
+        """
+        self.budget = budget
+        self.callback = callback
+        self._pending: int = 0
+        self._armed: bool = False
+
+    def hold(self) -> None:
+        """Mark that a part of the work is still in progress"""
+        self._pending += 1
+
+    def release(self) -> None:
+        """Mark that a part of the work is finished"""
+        self._pending -= 1
+        self._check()
+
+    def cancel(self) -> None:
+        """Mark that a part of the work is abandoned because the theme switch is superseded"""
+        self._pending -= 1
+        self.callback = None
+
+    def arm(self) -> None:
+        """Mark that all parts of the work have been started"""
+        self._armed = True
+        self._check()
+
+    def _check(self) -> None:
+        """Internal Method: Call the callback function if the theme switch is completed"""
+        if self._armed and not self._pending and self.callback is not None:
+            callback, self.callback = self.callback, None
+            callback()
+
+
+_transition = _Transition()
+
+
+def use_theme(
+    __theme: typing.Literal["system", "dark", "light"],
+    /,
+    *,
+    budget: float | None = None,
+    callback: typing.Callable[[], typing.Any] | None = None,
+) -> None:
     """
     Set the theme for the entire program
 
     theme can be light, dark, and follow the system, default is follow the system
+
+    * `budget`: the maximum time (ms) spent on applying new styles per frame, the visible
+    widgets are updated first; default value means applying all of them at once
+    * `callback`: the function that is called when the new theme has been applied to everything
     """
-    global DARK_MODE, THEME_MODE
+    global DARK_MODE, THEME_MODE, _transition
     THEME_MODE = __theme
     if __theme == "system":
         DARK_MODE = darkdetect.isDark()
     else:
         DARK_MODE = __theme == "dark"
+    _transition = _Transition(budget, callback)
     _process_event(DARK_MODE)
+    _transition.arm()
+    _transition = _Transition()  # Canvases created later do not inherit the budget
 
 
 def register_event(
@@ -65,8 +129,9 @@ def _callback(theme: str) -> None:
     Valid only if the theme mode is set to Follow System"""
     if THEME_MODE != "system":
         return
-    global DARK_MODE
+    global DARK_MODE, _transition
     DARK_MODE = theme == "Dark"
+    _transition = _Transition()
     _process_event(DARK_MODE)
 
 